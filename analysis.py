@@ -2,12 +2,14 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from value_analysis.schema import read_prices_csv
+from value_analysis.streaming import iter_csv_chunks, period_end_rule, run_chunked
 
 def calculate_returns(data):
     """Calculate daily, monthly, and annual returns."""
     daily_returns = data['Close'].pct_change()
-    monthly_returns = data['Close'].resample('M').last().pct_change()
-    annual_returns = data['Close'].resample('Y').last().pct_change()
+    monthly_returns = data['Close'].resample(period_end_rule('M')).last().pct_change()
+    annual_returns = data['Close'].resample(period_end_rule('Y')).last().pct_change()
     return daily_returns, monthly_returns, annual_returns
 
 def calculate_metrics(returns):
@@ -20,6 +22,10 @@ def calculate_metrics(returns):
     }
     return metrics
 
+def calculate_metrics_chunked(path, chunksize=1_000_000):
+    """Calculate key investment metrics for a price history too large for memory."""
+    return run_chunked(iter_csv_chunks(path, chunksize))
+
 def plot_performance(data, ticker):
     """Plot stock performance metrics."""
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
@@ -44,7 +50,7 @@ def main():
     
     for ticker in tickers:
         try:
-            data = pd.read_csv(f'historical_{ticker}.csv', index_col=0, parse_dates=True)
+            data = read_prices_csv(f'historical_{ticker}.csv')
             daily_returns, monthly_returns, annual_returns = calculate_returns(data)
             metrics = calculate_metrics(daily_returns)
             metrics['Ticker'] = ticker
@@ -0,0 +1,23 @@
+"""Shared fixtures for the benchmark suite."""
+import pytest
+from .synthetic import SyntheticDataSource, make_metrics, make_prices
+
+# Universe sizes (symbols) and history lengths (trading days) benchmarked at
+SCALES = [10, 100, 1000]
+HISTORY_DAYS = [252, 2520, 12600]
+
+@pytest.fixture(params=SCALES, ids=lambda n: f'{n}sym')
+def universe_size(request):
+    return request.param
+
+@pytest.fixture(params=HISTORY_DAYS, ids=lambda n: f'{n}d')
+def price_history(request):
+    return make_prices(request.param)
+
+@pytest.fixture
+def metrics_frame(universe_size):
+    return make_metrics(universe_size)
+
+@pytest.fixture
+def synthetic_source(universe_size):
+    return SyntheticDataSource(universe_size)
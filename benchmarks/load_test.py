@@ -0,0 +1,92 @@
+"""Load-test harness for the screening service.
+
+Run against a live service:
+    python -m benchmarks.load_test --url http://127.0.0.1:8050
+or start an in-process service over a synthetic universe:
+    python -m benchmarks.load_test --synthetic 1000
+"""
+import argparse
+import http.client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from urllib.parse import urlparse
+import numpy as np
+
+DEFAULT_PATHS = ['/screen?max_pe=20&max_pb=3&min_roe=10', '/health']
+
+def _worker(host: str, port: int, paths: List[str], n_requests: int) -> List[float]:
+    """Issue requests over one keep-alive connection and record latencies."""
+    conn = http.client.HTTPConnection(host, port)
+    latencies = []
+    try:
+        for i in range(n_requests):
+            start = time.perf_counter()
+            conn.request('GET', paths[i % len(paths)])
+            response = conn.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - start)
+            if response.status != 200:
+                raise RuntimeError(f'{paths[i % len(paths)]} returned {response.status}')
+    finally:
+        conn.close()
+    return latencies
+
+def run_load_test(url: str, paths: List[str] = DEFAULT_PATHS,
+                  n_requests: int = 1000, concurrency: int = 8) -> Dict[str, float]:
+    """Hit the service from `concurrency` clients and summarize latency."""
+    parsed = urlparse(url)
+    per_worker = max(1, n_requests // concurrency)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(_worker, parsed.hostname, parsed.port, paths, per_worker)
+                   for _ in range(concurrency)]
+        latencies = np.concatenate([future.result() for future in futures])
+    elapsed = time.perf_counter() - start
+    return {
+        'requests': len(latencies),
+        'throughput_rps': len(latencies) / elapsed,
+        'p50_ms': float(np.percentile(latencies, 50) * 1000),
+        'p99_ms': float(np.percentile(latencies, 99) * 1000),
+        'max_ms': float(latencies.max() * 1000)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the screening service.')
+    parser.add_argument('--url', help='Base URL of a running service')
+    parser.add_argument('--synthetic', type=int, default=0,
+                        help='Start an in-process service over N synthetic symbols')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    server = service = None
+    url = args.url
+    if args.synthetic:
+        from value_analysis.screener import ValueScreener
+        from value_analysis.service import ScreeningService, make_server
+        from .synthetic import SyntheticDataSource
+
+        screener = ValueScreener()
+        screener.analyzer.data_source = SyntheticDataSource(args.synthetic)
+        service = ScreeningService(screener.analyzer.data_source.symbols, screener=screener)
+        service.start()
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_address[1]}'
+    if url is None:
+        parser.error('either --url or --synthetic is required')
+
+    try:
+        stats = run_load_test(url, n_requests=args.requests, concurrency=args.concurrency)
+    finally:
+        if server is not None:
+            server.shutdown()
+            service.stop()
+
+    for key, value in stats.items():
+        print(f'{key}: {value:.2f}' if isinstance(value, float) else f'{key}: {value}')
+
+if __name__ == '__main__':
+    main()
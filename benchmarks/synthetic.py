@@ -0,0 +1,105 @@
+"""Synthetic universe generator for reproducible benchmarks."""
+from typing import Dict, List
+import pandas as pd
+import numpy as np
+from value_analysis.data_source import DataSource
+
+SECTORS = ['Technology', 'Financials', 'Energy', 'Consumer Staples', 'Healthcare', 'Industrials']
+
+def make_symbols(n_symbols: int) -> List[str]:
+    """Generate unique alphabetic ticker symbols."""
+    letters = np.array(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ'))
+    symbols = []
+    for i in range(n_symbols):
+        code, digits = i, []
+        while True:
+            digits.append(letters[code % 26])
+            code //= 26
+            if code == 0:
+                break
+        symbols.append('X' + ''.join(reversed(digits)))
+    return symbols
+
+def make_metrics(n_symbols: int, seed: int = 0) -> pd.DataFrame:
+    """Generate a value_metrics.csv-style frame for a universe."""
+    rng = np.random.default_rng(seed)
+    metrics = pd.DataFrame({
+        'Ticker': make_symbols(n_symbols),
+        'Sector': rng.choice(SECTORS, n_symbols),
+        'P/E Ratio': rng.lognormal(2.8, 0.5, n_symbols),
+        'P/B Ratio': rng.lognormal(0.8, 0.6, n_symbols),
+        'Debt/Equity': rng.lognormal(-0.7, 0.8, n_symbols),
+        'ROE': rng.normal(0.14, 0.08, n_symbols),
+        'Profit Margin': rng.normal(0.11, 0.07, n_symbols),
+        'Dividend Yield': rng.uniform(0.0, 0.06, n_symbols)
+    })
+    # Leave some gaps, as Yahoo Finance does
+    for col in ['P/E Ratio', 'Dividend Yield']:
+        metrics.loc[rng.random(n_symbols) < 0.05, col] = np.nan
+    return metrics
+
+def make_prices(n_days: int, seed: int = 0, start: str = '2000-01-03') -> pd.DataFrame:
+    """Generate a yfinance-style OHLCV history with a geometric random walk."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(start, periods=n_days, name='Date')
+    close = 50 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, n_days)))
+    open_ = close * (1 + rng.normal(0, 0.005, n_days))
+    spread = np.abs(rng.normal(0, 0.01, n_days)) * close
+    return pd.DataFrame({
+        'Open': open_,
+        'High': np.maximum(open_, close) + spread,
+        'Low': np.minimum(open_, close) - spread,
+        'Close': close,
+        'Volume': rng.integers(100_000, 10_000_000, n_days).astype(float),
+        'Dividends': 0.0,
+        'Stock Splits': 0.0
+    }, index=index)
+
+def make_financials(n_years: int = 5, seed: int = 0) -> Dict[str, pd.DataFrame]:
+    """Generate annual statements in the layout ValueAnalyzer expects (latest first)."""
+    rng = np.random.default_rng(seed)
+    growth = rng.normal(0.06, 0.04)
+    revenue = 1e9 * rng.lognormal(0, 1) * (1 + growth) ** -np.arange(n_years)
+    margin = np.clip(rng.normal(0.15, 0.06), 0.01, None) + rng.normal(0, 0.01, n_years)
+    operating_income = revenue * margin
+    net_income = operating_income * 0.75
+    shares = 1e8 * rng.lognormal(0, 0.5)
+    equity = revenue * rng.uniform(0.4, 1.2)
+    index = pd.to_datetime([f'{2023 - i}-12-31' for i in range(n_years)])
+    return {
+        'income_statement': pd.DataFrame({
+            'Total Revenue': revenue,
+            'Cost of Revenue': revenue * 0.6,
+            'Operating Income': operating_income,
+            'Net Income': net_income,
+            'EPS': net_income / shares,
+            'Dividends Paid': -net_income * rng.uniform(0, 0.5)
+        }, index=index),
+        'balance_sheet': pd.DataFrame({
+            'Total Assets': equity * 2,
+            'Inventory': revenue * 0.1,
+            'Total Debt': equity * rng.uniform(0.1, 1.5),
+            'Total Stockholder Equity': equity,
+            'Book Value per Share': equity / shares
+        }, index=index),
+        'cash_flow': pd.DataFrame({
+            'Free Cash Flow': net_income * 0.9
+        }, index=index)
+    }
+
+class SyntheticDataSource(DataSource):
+    def __init__(self, n_symbols: int, seed: int = 0):
+        """In-memory DataSource serving a generated universe without network access."""
+        super().__init__()
+        self.symbols = make_symbols(n_symbols)
+        self.financials = {
+            symbol: make_financials(seed=seed + i) for i, symbol in enumerate(self.symbols)
+        }
+        rng = np.random.default_rng(seed)
+        self.prices = dict(zip(self.symbols, rng.lognormal(3.5, 0.6, n_symbols)))
+
+    def get_financial_statements(self, symbol: str) -> Dict[str, pd.DataFrame]:
+        return self.financials[symbol]
+
+    def get_latest_price(self, symbol: str) -> float:
+        return self.prices[symbol]
@@ -0,0 +1,11 @@
+"""Benchmarks for the backtesting framework."""
+from value_analysis.backtesting import Backtester
+
+def buy_and_hold(row):
+    return {'buy': True, 'position_size': 1.0}
+
+def test_run_backtest(benchmark, price_history):
+    backtester = Backtester(price_history)
+    start, end = price_history.index[0], price_history.index[-1]
+    result = benchmark(backtester.run_backtest, buy_and_hold, start, end)
+    assert result['max_drawdown'] <= 0
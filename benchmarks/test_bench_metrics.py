@@ -0,0 +1,24 @@
+"""Benchmarks for ValueMetrics and the performance metrics script."""
+import numpy as np
+from value_analysis.metrics import ValueMetrics
+import analysis
+
+def test_value_metrics(benchmark, metrics_frame):
+    metrics = ValueMetrics(metrics_frame)
+    pe = metrics_frame['P/E Ratio'].fillna(0).to_numpy()
+    margins = (metrics_frame['Profit Margin'] * 100).tolist()
+
+    def run():
+        for ratio in pe:
+            metrics.calculate_pe_ratio(100.0, 100.0 / ratio if ratio else 0.0)
+            metrics.calculate_pb_ratio(100.0, 50.0)
+            metrics.calculate_debt_to_equity(1000.0, 2000.0)
+            metrics.calculate_roe(150.0, 1000.0)
+        return metrics.assess_competitive_advantage(margins, [0], [0])
+
+    benchmark(run)
+
+def test_calculate_metrics(benchmark, price_history):
+    returns = price_history['Close'].pct_change()
+    result = benchmark(analysis.calculate_metrics, returns)
+    assert np.isfinite(result['Volatility'])
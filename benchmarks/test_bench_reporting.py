@@ -0,0 +1,16 @@
+"""Benchmarks for report generation."""
+from value_analysis.analysis import ValueAnalyzer
+from value_analysis.reporting import ValueReport
+
+def test_generate_reports(benchmark, synthetic_source, tmp_path):
+    analyzer = ValueAnalyzer()
+    analyzer.data_source = synthetic_source
+    analyses = [analyzer.analyze_stock(symbol) for symbol in synthetic_source.symbols]
+
+    def run():
+        for analysis in analyses:
+            report = ValueReport(analysis)
+            report.generate_html_report(str(tmp_path / f"{analysis['symbol']}.html"))
+            report.visualizer.create_summary_report(analysis)
+
+    benchmark(run)
@@ -0,0 +1,42 @@
+"""Benchmarks for analysis and screening over a synthetic universe."""
+from value_analysis.analysis import ValueAnalyzer
+from value_analysis.cache import AnalysisCache
+from value_analysis.screener import ValueScreener
+import value_screener
+
+CRITERIA = {
+    'max_pe': 25,
+    'max_pb': 3,
+    'max_debt_to_equity': 1.0,
+    'min_roe': 10
+}
+
+def test_analyze_stock(benchmark, synthetic_source):
+    analyzer = ValueAnalyzer()
+    analyzer.data_source = synthetic_source
+
+    def run():
+        return [analyzer.analyze_stock(symbol) for symbol in synthetic_source.symbols]
+
+    results = benchmark(run)
+    assert len(results) == len(synthetic_source.symbols)
+
+def test_analyze_stock_cached(benchmark, synthetic_source):
+    analyzer = ValueAnalyzer(cache=AnalysisCache())
+    analyzer.data_source = synthetic_source
+
+    def run():
+        return [analyzer.analyze_stock(symbol) for symbol in synthetic_source.symbols]
+
+    run()
+    results = benchmark(run)
+    assert analyzer.cache.hits >= len(synthetic_source.symbols)
+
+def test_screen_stocks(benchmark, synthetic_source):
+    screener = ValueScreener()
+    screener.analyzer.data_source = synthetic_source
+    benchmark(screener.screen_stocks, synthetic_source.symbols, CRITERIA)
+
+def test_buffett_criteria(benchmark, metrics_frame):
+    scores = benchmark(value_screener.buffett_criteria, metrics_frame)
+    assert len(scores) == len(metrics_frame)
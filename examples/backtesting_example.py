@@ -1,5 +1,5 @@
 """Example of backtesting a value investing strategy."""
-from value_analysis import Backtester
+from value_analysis import Backtester, PointInTimeStore
 from value_analysis.data_source import DataSource
 
 def value_strategy(data):
@@ -12,7 +12,12 @@ def value_strategy(data):
 def main():
     # Get historical data
     data_source = DataSource()
-    stock_data = data_source.get_stock_data('AAPL', '2020-01-01', '2023-12-31')
+    prices = data_source.get_stock_data('AAPL', '2020-01-01', '2023-12-31')
+    financials = data_source.get_financial_statements('AAPL')
+    
+    # Attach the P/E and P/B known on each trading day
+    store = PointInTimeStore.from_statements({'AAPL': prices}, {'AAPL': financials})
+    stock_data = store.frame('AAPL')
     
     # Initialize backtester
     backtester = Backtester(stock_data)
@@ -0,0 +1,96 @@
+import argparse
+import logging
+import threading
+from datetime import date
+from typing import Dict
+import pandas as pd
+import stock_data
+import analysis
+import value_screener
+from value_analysis.pipeline import Pipeline, Stage
+from value_analysis.universe import default_universe
+
+logger = logging.getLogger(__name__)
+
+# pyplot keeps global state, so plots are drawn one at a time
+_plot_lock = threading.Lock()
+
+def fetch_prices(ticker: str) -> pd.DataFrame:
+    """Fetch and save one ticker's price history."""
+    data = stock_data.fetch_stock_data([ticker])
+    if ticker not in data or data[ticker].empty:
+        raise ValueError(f"No data retrieved for {ticker}")
+    data[ticker].to_csv(f'historical_{ticker}.csv')
+    return data[ticker]
+
+def fetch_metrics(ticker: str) -> pd.DataFrame:
+    """Fetch one ticker's value metrics row."""
+    metrics = stock_data.get_key_metrics([ticker])
+    if metrics.empty:
+        raise ValueError(f"No metrics retrieved for {ticker}")
+    return metrics
+
+def performance(ticker: str, prices: pd.DataFrame) -> Dict:
+    """Calculate one ticker's performance metrics and plot."""
+    daily_returns, _, _ = analysis.calculate_returns(prices)
+    metrics = analysis.calculate_metrics(daily_returns)
+    metrics['Ticker'] = ticker
+    with _plot_lock:
+        analysis.plot_performance(prices, ticker)
+    return metrics
+
+def screen(metrics: Dict[str, pd.DataFrame], performance: Dict[str, Dict]) -> pd.DataFrame:
+    """Combine all tickers and write the same CSVs as the standalone scripts."""
+    value_metrics = pd.concat(metrics.values(), ignore_index=True)
+    performance_metrics = pd.DataFrame(list(performance.values()))
+    value_metrics.to_csv('value_metrics.csv', index=False)
+    performance_metrics.to_csv('performance_metrics.csv', index=False)
+
+    final_analysis = value_screener.build_final_analysis(value_metrics, performance_metrics)
+    final_analysis.to_csv('final_analysis.csv', index=False)
+    return final_analysis
+
+def build_pipeline(tickers, state_dir: str = '.pipeline', max_workers: int = 4) -> Pipeline:
+    # Fetches are keyed by date so market data is refreshed at most once a day
+    def today(ticker):
+        return date.today().isoformat()
+    stages = [
+        Stage('prices', fetch_prices, key=today),
+        Stage('metrics', fetch_metrics, key=today),
+        Stage('performance', performance, deps=['prices']),
+        Stage('screen', screen, deps=['metrics', 'performance'], per_ticker=False)
+    ]
+    return Pipeline(stages, tickers, state_dir=state_dir, max_workers=max_workers)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run stock_data -> analysis -> value_screener, recomputing only what changed.')
+    parser.add_argument('tickers', nargs='*', default=['AAPL', 'BAC', 'KO', 'CVX', 'OXY'])
+    parser.add_argument('--state-dir', default='.pipeline')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--force', action='store_true', help='Recompute every stage')
+    args = parser.parse_args()
+
+    # Stages look up fetched data by canonical symbol, e.g. brk.b -> BRK-B
+    universe = default_universe()
+    invalid_tickers = universe.invalid(args.tickers)
+    if invalid_tickers:
+        logger.error(f"Invalid tickers found: {invalid_tickers}")
+    tickers = universe.filter(args.tickers)
+
+    report = build_pipeline(tickers, args.state_dir, args.workers).run(force=args.force)
+    for status, tasks in report.items():
+        print(f"{status}: {len(tasks)}")
+        for stage, ticker in tasks:
+            logger.info(f"{status} {stage} {ticker or ''}")
+
+    if report['failed']:
+        logger.error(f"Failed tasks: {report['failed']}")
+    if ('screen', None) in report['failed']:
+        raise RuntimeError('Screening stage failed')
+    final_analysis = pd.read_csv('final_analysis.csv')
+    print('\nTop Value Stocks by Buffett Criteria:')
+    print(final_analysis.sort_values('Buffett Score', ascending=False))
+
+if __name__ == '__main__':
+    main()
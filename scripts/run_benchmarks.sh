@@ -0,0 +1,9 @@
+#!/bin/bash
+
+# Run the benchmark suite and store results as JSON under benchmarks/results.
+# Pass --benchmark-compare to compare against the previous saved run.
+pytest benchmarks \
+    --benchmark-only \
+    --benchmark-storage=benchmarks/results \
+    --benchmark-autosave \
+    "$@"
@@ -8,7 +8,7 @@ source venv/bin/activate
 
 # Install development dependencies
 pip install -e .
-pip install pytest pytest-mock pytest-cov pylint black
+pip install pytest pytest-mock pytest-cov pytest-benchmark pylint black
 
 # Create necessary directories
 mkdir -p reports
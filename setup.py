@@ -16,6 +16,7 @@ setup(
         'numpy>=1.21.0',
         'yfinance>=0.1.70',
         'requests>=2.26.0',
+        'httpx>=0.23.0',
         'python-dotenv>=0.19.0'
     ],
     python_requires='>=3.7'
@@ -3,6 +3,7 @@ import pandas as pd
 import logging
 from typing import Dict, List
 from datetime import datetime, timedelta
+from value_analysis.universe import default_universe
 
 # Configure logging
 logging.basicConfig(
@@ -12,16 +13,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def validate_ticker(ticker: str) -> bool:
-    """Validate if a ticker symbol is valid."""
-    if not isinstance(ticker, str):
-        return False
-    if not ticker.isalnum():
-        return False
-    if len(ticker) > 5 or len(ticker) < 1:
-        return False
-    return True
-
 def retry_api_call(max_retries: int = 3):
     """Decorator for retrying API calls."""
     def decorator(func):
@@ -42,11 +33,11 @@ def retry_api_call(max_retries: int = 3):
 def fetch_stock_data(ticker_list: List[str], period: str = '5y') -> Dict[str, pd.DataFrame]:
     """Fetch historical stock data for given tickers."""
     data = {}
-    for ticker in ticker_list:
-        if not validate_ticker(ticker):
-            logger.warning(f"Invalid ticker format: {ticker}")
-            continue
-            
+    universe = default_universe()
+    for ticker in universe.invalid(ticker_list):
+        logger.warning(f"Invalid ticker format: {ticker}")
+    
+    for ticker in universe.filter(ticker_list):
         try:
             logger.info(f"Fetching data for {ticker}")
             stock = yf.Ticker(ticker)
@@ -61,11 +52,11 @@ def fetch_stock_data(ticker_list: List[str], period: str = '5y') -> Dict[str, pd
 def get_key_metrics(ticker_list: List[str]) -> pd.DataFrame:
     """Get key value investing metrics for stocks."""
     metrics = []
-    for ticker in ticker_list:
-        if not validate_ticker(ticker):
-            logger.warning(f"Invalid ticker format: {ticker}")
-            continue
-            
+    universe = default_universe()
+    for ticker in universe.invalid(ticker_list):
+        logger.warning(f"Invalid ticker format: {ticker}")
+    
+    for ticker in universe.filter(ticker_list):
         try:
             logger.info(f"Fetching metrics for {ticker}")
             stock = yf.Ticker(ticker)
@@ -111,10 +102,11 @@ def main():
         tickers = ['AAPL', 'BAC', 'KO', 'CVX', 'OXY']
         
         # Validate tickers
-        invalid_tickers = [ticker for ticker in tickers if not validate_ticker(ticker)]
+        universe = default_universe()
+        invalid_tickers = universe.invalid(tickers)
         if invalid_tickers:
             logger.error(f"Invalid tickers found: {invalid_tickers}")
-            tickers = [ticker for ticker in tickers if validate_ticker(ticker)]
+        tickers = universe.filter(tickers)
         
         # Fetch and save data
         historical_data = fetch_stock_data(tickers)
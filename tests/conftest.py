@@ -0,0 +1,22 @@
+"""Shared test fixtures."""
+import pytest
+import pandas as pd
+
+@pytest.fixture
+def sample_financials():
+    return {
+        'income_statement': pd.DataFrame({
+            'Total Revenue': [100000, 90000, 80000],
+            'Operating Income': [20000, 18000, 15000],
+            'Net Income': [15000, 13000, 10000],
+            'Cost of Revenue': [60000, 55000, 50000],
+            'EPS': [1.5, 1.3, 1.0]
+        }),
+        'balance_sheet': pd.DataFrame({
+            'Total Assets': [200000, 180000, 160000],
+            'Inventory': [10000, 9000, 8000],
+            'Total Debt': [80000, 70000, 60000],
+            'Total Stockholder Equity': [120000, 110000, 100000],
+            'Book Value per Share': [12, 11, 10]
+        })
+    }
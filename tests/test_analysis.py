@@ -3,23 +3,6 @@ import pytest
 import pandas as pd
 from value_analysis.analysis import ValueAnalyzer
 
-@pytest.fixture
-def sample_financials():
-    return {
-        'income_statement': pd.DataFrame({
-            'Total Revenue': [100000, 90000, 80000],
-            'Operating Income': [20000, 18000, 15000],
-            'Net Income': [15000, 13000, 10000],
-            'EPS': [1.5, 1.3, 1.0]
-        }),
-        'balance_sheet': pd.DataFrame({
-            'Total Assets': [200000, 180000, 160000],
-            'Total Debt': [80000, 70000, 60000],
-            'Total Stockholder Equity': [120000, 110000, 100000],
-            'Book Value per Share': [12, 11, 10]
-        })
-    }
-
 def test_analyze_stock(sample_financials, mocker):
     # Mock data source
     mocker.patch('value_analysis.data_source.DataSource.get_financial_statements',
@@ -37,4 +20,23 @@ def test_analyze_stock(sample_financials, mocker):
     
     metrics = analysis['fundamental_metrics']
     assert metrics['pe_ratio'] == pytest.approx(20.0)
-    assert metrics['roe'] > 0
\ No newline at end of file
+    assert metrics['roe'] > 0
+
+def test_analyze_stock_ttm(sample_financials, mocker):
+    quarter = sample_financials['income_statement'].iloc[[0, 0, 0, 0]] / 4
+    quarter.index = pd.to_datetime(['2023-12-31', '2023-09-30', '2023-06-30', '2023-03-31'])
+    quarterly_statements = {
+        'income_statement': quarter,
+        'balance_sheet': sample_financials['balance_sheet']
+    }
+    mocker.patch('value_analysis.data_source.DataSource.get_financial_statements',
+                 side_effect=lambda symbol, quarterly=False:
+                 quarterly_statements if quarterly else sample_financials)
+    mocker.patch('value_analysis.data_source.DataSource.get_latest_price',
+                 return_value=30.0)
+    
+    analyzer = ValueAnalyzer()
+    analysis = analyzer.analyze_stock('TEST', use_ttm=True)
+    
+    assert analysis['fundamental_metrics']['pe_ratio'] == pytest.approx(20.0)
+    assert 'TEST' in analyzer.ttm
@@ -0,0 +1,42 @@
+"""Tests for the backtesting framework."""
+import pytest
+import numpy as np
+import pandas as pd
+from value_analysis.backtesting import Backtester
+
+@pytest.fixture
+def sample_prices():
+    dates = pd.date_range('2023-01-02', periods=5, freq='D')
+    return pd.DataFrame({'Close': [10.0, 12.0, 9.0, np.nan, 15.0]}, index=dates)
+
+def run(prices, strategy):
+    backtester = Backtester(prices, initial_capital=1000.0)
+    return backtester.run_backtest(strategy, prices.index[0], prices.index[-1])
+
+def test_buy_and_hold_bookkeeping(sample_prices, mocker):
+    spy = mocker.spy(Backtester, '_calculate_performance_metrics')
+    result = run(sample_prices, lambda row: {'buy': True, 'position_size': 1.0})
+    portfolio = spy.call_args.args[1]
+
+    assert list(portfolio.columns) == ['cash', 'shares', 'equity']
+    assert portfolio['shares'].iloc[1] == pytest.approx(100.0)
+    assert portfolio['cash'].iloc[1] == pytest.approx(0.0)
+    # A missing price carries the previous day's position forward
+    assert portfolio.iloc[4].tolist() == pytest.approx(portfolio.iloc[3].tolist())
+    assert portfolio['equity'].tolist() == pytest.approx([1000, 1000, 1200, 900, 900, 1500])
+    assert result['total_return'] == pytest.approx(0.5)
+    assert result['max_drawdown'] == pytest.approx(-0.25)
+
+def test_partial_position_and_sharpe(sample_prices):
+    result = run(sample_prices, lambda row: {'buy': True, 'position_size': 0.5})
+    equity = pd.Series([1000, 1000, 1100, 962.5, 962.5, 1283.3333333])
+    returns = equity.pct_change().dropna()
+    expected = returns.mean() * 252 / (returns.std() * np.sqrt(252))
+    assert result['total_return'] == pytest.approx(0.2833333)
+    assert result['sharpe_ratio'] == pytest.approx(expected, rel=1e-6)
+
+def test_no_signal_stays_in_cash(sample_prices):
+    result = run(sample_prices, lambda row: {'buy': False})
+    assert result['total_return'] == 0
+    assert result['max_drawdown'] == 0
+    assert result['sharpe_ratio'] == 0
@@ -0,0 +1,104 @@
+"""Tests for analysis result memoization."""
+import pytest
+from value_analysis.analysis import ValueAnalyzer
+from value_analysis.cache import AnalysisCache, statement_version
+
+@pytest.fixture
+def mock_source(sample_financials, mocker):
+    statements = mocker.patch('value_analysis.data_source.DataSource.get_financial_statements',
+                              return_value=sample_financials)
+    price = mocker.patch('value_analysis.data_source.DataSource.get_latest_price',
+                         return_value=30.0)
+    return statements, price
+
+def test_lru_eviction_and_shared_disk_tier(tmp_path):
+    cache = AnalysisCache(maxsize=2, directory=str(tmp_path))
+    cache.set_version('AAA', 'v1')
+    for i in range(3):
+        cache.put('AAA', ('v1', i), {'value': i})
+    assert len(cache._memory) == 2
+
+    # A second process sees the first one's version and results through the directory
+    other = AnalysisCache(directory=str(tmp_path))
+    assert other.version('AAA') == 'v1'
+    assert other.get('AAA', ('v1', 0)) == {'value': 0}
+    other.invalidate('AAA')
+    assert cache.version('AAA') is None
+    assert AnalysisCache(directory=str(tmp_path)).get('AAA', ('v1', 0)) is None
+
+def test_new_version_drops_old_results():
+    cache = AnalysisCache()
+    cache.set_version('AAA', 'v1')
+    cache.put('AAA', ('v1',), {'value': 1})
+    cache.set_version('AAA', 'v2')
+    assert cache.get('AAA', ('v1',)) is None
+
+def test_disk_tier_is_bounded(tmp_path):
+    cache = AnalysisCache(maxsize=1, directory=str(tmp_path), max_disk_entries=10)
+    for i in range(25):
+        cache.put(f'S{i}', ('v1',), {'value': i})
+    assert len(cache._disk_files()) <= 10
+    assert cache.get('S24', ('v1',)) == {'value': 24}
+
+def test_statement_version(sample_financials):
+    assert statement_version(sample_financials) == statement_version(sample_financials)
+    shorter = {'income_statement': sample_financials['income_statement'].iloc[:2]}
+    assert statement_version(shorter) != statement_version(sample_financials)
+
+def test_hit_skips_statement_fetch_but_reprices(mock_source, mocker):
+    statements, price = mock_source
+    analyzer = ValueAnalyzer(cache=AnalysisCache())
+    growth = mocker.spy(analyzer, '_calculate_growth_metrics')
+
+    first = analyzer.analyze_stock('TEST')
+    first['fundamental_metrics']['roe'] = 0
+    second = analyzer.analyze_stock('TEST')
+    assert statements.call_count == 1
+    assert growth.call_count == 1
+    assert second['fundamental_metrics']['roe'] > 0
+    assert second['fundamental_metrics']['pe_ratio'] == pytest.approx(20.0)
+
+    price.return_value = 45.0
+    third = analyzer.analyze_stock('TEST')
+    assert third['fundamental_metrics']['pe_ratio'] == pytest.approx(30.0)
+    assert third['fundamental_metrics']['pb_ratio'] == pytest.approx(3.75)
+    assert statements.call_count == 1
+    assert set(third['fundamental_metrics']) == {'pe_ratio', 'pb_ratio', 'debt_to_equity', 'roe'}
+
+def test_new_filing_invalidates(mock_source):
+    statements, _ = mock_source
+    cache = AnalysisCache()
+    analyzer = ValueAnalyzer(cache=cache)
+    analyzer.analyze_stock('TEST')
+    assert analyzer.add_filing('TEST', '2024-03-31', {'EPS': 0.5})
+    assert not cache._memory
+    analyzer.analyze_stock('TEST')
+    assert statements.call_count == 2
+
+def test_stale_version_is_rechecked(mock_source, sample_financials):
+    statements, _ = mock_source
+    analyzer = ValueAnalyzer(cache=AnalysisCache(version_ttl=0))
+    analyzer.analyze_stock('TEST')
+    restated = sample_financials['income_statement'].copy()
+    restated.loc[0, 'EPS'] = 3.0
+    statements.return_value = {**sample_financials, 'income_statement': restated}
+    assert analyzer.analyze_stock('TEST')['fundamental_metrics']['pe_ratio'] == pytest.approx(10.0)
+    assert statements.call_count == 2
+
+def test_symbols_are_resolved_before_caching(mock_source, tmp_path):
+    statements, _ = mock_source
+    cache_dir = tmp_path / 'cache'
+    analyzer = ValueAnalyzer(cache=AnalysisCache(directory=str(cache_dir)))
+    analyzer.analyze_stock('brk.b')
+    analyzer.analyze_stock('BRK-B')
+    assert statements.call_count == 1
+    with pytest.raises(ValueError):
+        analyzer.add_filing('..', '2024-03-31', {'EPS': 0.5})
+    with pytest.raises(ValueError):
+        AnalysisCache(directory=str(cache_dir)).invalidate('..')
+    assert tmp_path.exists() and cache_dir.exists()
+
+def test_matches_uncached_analysis(mock_source):
+    cached = ValueAnalyzer(cache=AnalysisCache())
+    cached.analyze_stock('TEST')
+    assert cached.analyze_stock('TEST') == ValueAnalyzer().analyze_stock('TEST')
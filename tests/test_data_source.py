@@ -0,0 +1,32 @@
+"""Tests for the data source wrapper."""
+import pytest
+import pandas as pd
+from value_analysis.data_source import DataSource
+
+def test_get_latest_price(mocker):
+    ticker = mocker.patch('value_analysis.data_source.yf.Ticker')
+    ticker.return_value.history.return_value = pd.DataFrame({'Close': [10.0, 11.5]})
+    assert DataSource().get_latest_price('AAPL') == pytest.approx(11.5)
+    ticker.return_value.history.assert_called_once_with(period='5d')
+
+def test_get_latest_price_without_history(mocker):
+    ticker = mocker.patch('value_analysis.data_source.yf.Ticker')
+    ticker.return_value.history.return_value = pd.DataFrame({'Close': []})
+    with pytest.raises(Exception, match='Error fetching latest price'):
+        DataSource().get_latest_price('AAPL')
+
+def test_invalid_symbols_never_reach_yfinance(mocker):
+    ticker = mocker.patch('value_analysis.data_source.yf.Ticker')
+    source = DataSource()
+    for call in (lambda: source.get_latest_price('BAD TICKER'),
+                 lambda: source.get_financial_statements('$$$'),
+                 lambda: source.get_stock_data('TOOLONGX', '2020-01-01', '2020-12-31')):
+        with pytest.raises(ValueError, match='Invalid ticker'):
+            call()
+    ticker.assert_not_called()
+
+def test_symbols_are_normalized(mocker):
+    ticker = mocker.patch('value_analysis.data_source.yf.Ticker')
+    ticker.return_value.history.return_value = pd.DataFrame({'Close': [10.0]})
+    DataSource().get_latest_price('brk.b')
+    ticker.assert_called_once_with('BRK-B')
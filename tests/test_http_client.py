@@ -0,0 +1,90 @@
+"""Tests for the pooled HTTP client against a local stub server."""
+import asyncio
+import functools
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from value_analysis.data_source import DataSource
+from value_analysis.http_client import AsyncHttpClient, fetch_price_histories
+
+def _chart_payload(symbol):
+    return {
+        'chart': {
+            'result': [{
+                'meta': {'symbol': symbol, 'exchangeTimezoneName': 'America/New_York'},
+                'timestamp': [1672756200, 1672842600],
+                'indicators': {'quote': [{
+                    'open': [10.0, 11.0], 'high': [12.0, 12.5], 'low': [9.5, 10.5],
+                    'close': [11.0, 12.0], 'volume': [1000, 1200]
+                }]}
+            }],
+            'error': None
+        }
+    }
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+
+    def do_GET(self):
+        StubHandler.connections.add(self.client_address)
+        symbol = self.path.split('?')[0].rsplit('/', 1)[-1]
+        if symbol == 'MISSING':
+            body = b'{}'
+            self.send_response(404)
+        else:
+            body = gzip.compress(json.dumps(_chart_payload(symbol)).encode())
+            self.send_response(200)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    StubHandler.connections = set()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+def test_connections_are_reused(stub_server):
+    symbols = ['AAA', 'BBB', 'CCC', 'DDD', 'EEE']
+
+    async def run():
+        async with AsyncHttpClient(base_url=stub_server, max_connections=1) as client:
+            return await fetch_price_histories(symbols, client=client)
+
+    data = asyncio.run(run())
+    assert sorted(data) == symbols
+    assert len(StubHandler.connections) == 1
+
+def test_gzip_response_is_parsed(stub_server):
+    async def run():
+        async with AsyncHttpClient(base_url=stub_server) as client:
+            return await fetch_price_histories(['AAA', 'MISSING'], client=client)
+
+    data = asyncio.run(run())
+    assert list(data) == ['AAA']
+    frame = data['AAA']
+    assert list(frame['Close']) == [11.0, 12.0]
+    assert str(frame.index.tz) == 'America/New_York'
+
+def test_bulk_fetch_inside_running_loop(stub_server, mocker):
+    mocker.patch('value_analysis.data_source.AsyncHttpClient',
+                 functools.partial(AsyncHttpClient, base_url=stub_server))
+    source = DataSource()
+
+    async def notebook_cell():
+        return source.get_bulk_stock_data(['AAA', 'BBB'])
+
+    data = asyncio.run(notebook_cell())
+    assert sorted(data) == ['AAA', 'BBB']
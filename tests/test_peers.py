@@ -0,0 +1,43 @@
+"""Tests for peer-group aggregation."""
+import pytest
+import pandas as pd
+from value_analysis.peers import PeerGroups
+from value_analysis.metrics import ValueMetrics
+
+@pytest.fixture
+def sample_universe():
+    return pd.DataFrame({
+        'Symbol': ['AAA', 'BBB', 'CCC', 'DDD'],
+        'Sector': ['Tech', 'Tech', 'Tech', 'Energy'],
+        'Total Revenue': [100.0, 300.0, 600.0, 50.0],
+        'Operating Income': [10.0, 60.0, 180.0, 5.0]
+    })
+
+def test_industry_median_margin(sample_universe):
+    peers = PeerGroups(sample_universe)
+    assert peers.get('AAA')['industry_median_margin'] == pytest.approx(20.0)
+    assert peers.get('DDD')['industry_median_margin'] == pytest.approx(10.0)
+
+def test_revenue_share_and_percentile(sample_universe):
+    peers = PeerGroups(sample_universe)
+    ccc = peers.get('CCC')
+    assert ccc['revenue_share'] == pytest.approx(0.6)
+    assert ccc['margin_percentile'] == pytest.approx(100.0)
+    assert ccc['peer_count'] == 3
+    assert peers.group_summary('Tech')['total_revenue'] == pytest.approx(1000.0)
+
+def test_negative_revenue_shares_sum_to_one(sample_universe):
+    sample_universe.loc[0, 'Total Revenue'] = -200.0
+    peers = PeerGroups(sample_universe)
+    shares = [peers.get(symbol)['revenue_share'] for symbol in ['AAA', 'BBB', 'CCC']]
+    assert shares == pytest.approx([0.0, 1 / 3, 2 / 3])
+
+def test_unknown_symbol(sample_universe):
+    peers = PeerGroups(sample_universe)
+    assert peers.get('ZZZ') is None
+
+def test_competitive_advantage_uses_industry_margins(sample_universe):
+    metrics = ValueMetrics(sample_universe)
+    result = metrics.assess_competitive_advantage([30.0, 29.0, 31.0], [60.0], [20.0])
+    assert result['margin_premium'] == pytest.approx(10.0)
+    assert result['assessment'] == 'Strong competitive advantage'
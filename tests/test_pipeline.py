@@ -0,0 +1,67 @@
+"""Tests for the incremental pipeline runner."""
+import pytest
+import pandas as pd
+from value_analysis.pipeline import Pipeline, Stage
+
+class Sources:
+    def __init__(self):
+        self.prices = {'AAA': [1.0, 2.0], 'BBB': [3.0, 4.0], 'CCC': [5.0, 6.0]}
+        self.calls = []
+
+    def fetch(self, ticker):
+        self.calls.append(('fetch', ticker))
+        if ticker == 'BAD':
+            raise ValueError('no data')
+        return pd.DataFrame({'Close': self.prices[ticker]})
+
+    def returns(self, ticker, fetch):
+        self.calls.append(('returns', ticker))
+        return float(fetch['Close'].pct_change().iloc[-1])
+
+    def combine(self, returns):
+        self.calls.append(('combine', None))
+        return pd.Series(returns).sort_index()
+
+def _pipeline(sources, tickers, state_dir):
+    stages = [
+        Stage('fetch', sources.fetch, key=lambda ticker: sources.prices.get(ticker)),
+        Stage('returns', sources.returns, deps=['fetch']),
+        Stage('combine', sources.combine, deps=['returns'], per_ticker=False)
+    ]
+    return Pipeline(stages, tickers, state_dir=str(state_dir), max_workers=3)
+
+def test_rerun_without_changes_skips_everything(tmp_path):
+    sources = Sources()
+    report = _pipeline(sources, ['AAA', 'BBB', 'CCC'], tmp_path).run()
+    assert len(report['ran']) == 7
+    sources.calls.clear()
+    report = _pipeline(sources, ['AAA', 'BBB', 'CCC'], tmp_path).run()
+    assert report['ran'] == []
+    assert sources.calls == []
+
+def test_only_changed_ticker_recomputes(tmp_path):
+    sources = Sources()
+    _pipeline(sources, ['AAA', 'BBB', 'CCC'], tmp_path).run()
+    sources.calls.clear()
+    sources.prices['BBB'] = [3.0, 6.0]
+    _pipeline(sources, ['AAA', 'BBB', 'CCC'], tmp_path).run()
+    assert sorted(sources.calls, key=str) == [('combine', None), ('fetch', 'BBB'), ('returns', 'BBB')]
+
+def test_unchanged_output_stops_propagation(tmp_path):
+    sources = Sources()
+    _pipeline(sources, ['AAA'], tmp_path).run()
+    sources.calls.clear()
+    pipeline = _pipeline(sources, ['AAA'], tmp_path)
+    pipeline.stages['fetch'].version = '2'
+    pipeline.run()
+    assert sources.calls == [('fetch', 'AAA')]
+
+def test_failed_ticker_is_left_out(tmp_path):
+    sources = Sources()
+    pipeline = _pipeline(sources, ['AAA', 'BAD'], tmp_path)
+    report = pipeline.run()
+    assert ('fetch', 'BAD') in report['failed']
+    assert ('returns', 'BAD') in report['failed']
+    combined = pipeline._load_output(('combine', None))
+    assert list(combined.index) == ['AAA']
+    assert combined['AAA'] == pytest.approx(1.0)
@@ -0,0 +1,64 @@
+"""Tests for the point-in-time fundamentals store."""
+import pytest
+import numpy as np
+import pandas as pd
+from value_analysis.point_in_time import PointInTimeStore
+
+@pytest.fixture
+def sample_store():
+    dates = pd.date_range('2023-01-02', periods=6, freq='D')
+    prices = pd.DataFrame({
+        'Date': list(dates) + list(dates[:3]),
+        'Symbol': ['AAA'] * 6 + ['OLD'] * 3,
+        'Close': [10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 20.0, 21.0, 22.0]
+    })
+    fundamentals = pd.DataFrame({
+        'Symbol': ['AAA', 'AAA', 'OLD'],
+        'Filing Date': pd.to_datetime(['2023-01-02', '2023-01-04', '2023-01-01']),
+        'EPS': [1.0, 2.0, -1.0],
+        'Book Value per Share': [5.0, 7.0, 10.0],
+        'Net Income': [100.0, 200.0, -50.0],
+        'Total Stockholder Equity': [1000.0, 1000.0, 500.0]
+    })
+    return PointInTimeStore(prices, fundamentals)
+
+def test_filings_visible_from_next_day(sample_store):
+    frame = sample_store.frame('AAA')
+    assert np.isnan(frame['pe_ratio'].iloc[0])
+    assert frame['pe_ratio'].iloc[1] == pytest.approx(11.0)
+    assert frame['pe_ratio'].iloc[2] == pytest.approx(12.0)
+    assert frame['pe_ratio'].iloc[3] == pytest.approx(6.5)
+    assert frame['roe'].iloc[4] == pytest.approx(20.0)
+
+def test_vectorized_lookup(sample_store):
+    dates = pd.to_datetime(['2023-01-05', '2023-01-03', '2023-01-03', '2022-12-31'])
+    values = sample_store.lookup('pb_ratio', dates, ['AAA', 'AAA', 'OLD', 'AAA'])
+    assert values[0] == pytest.approx(13.0 / 7.0)
+    assert values[1] == pytest.approx(11.0 / 5.0)
+    assert values[2] == pytest.approx(2.1)
+    assert np.isnan(values[3])
+
+def test_delisted_symbol_drops_out(sample_store):
+    assert list(sample_store.cross_section('2023-01-03').index) == ['AAA', 'OLD']
+    section = sample_store.cross_section('2023-01-06')
+    assert list(section.index) == ['AAA']
+    assert sample_store.frame('OLD')['pe_ratio'].iloc[0] == np.inf
+
+def test_from_yfinance_statements():
+    periods = pd.to_datetime(['2023-09-30', '2022-09-30'])
+    income = pd.DataFrame([[6.0, 5.0], [600.0, 500.0]], index=['Diluted EPS', 'Net Income'],
+                          columns=periods)
+    balance = pd.DataFrame([[3000.0, 2500.0], [100.0, 100.0]],
+                           index=['Stockholders Equity', 'Ordinary Shares Number'], columns=periods)
+    dates = pd.bdate_range('2022-12-01', '2024-02-01')
+    prices = pd.DataFrame({'Close': 60.0}, index=dates)
+
+    store = PointInTimeStore.from_statements({'AAA': prices},
+                                             {'AAA': {'income_statement': income,
+                                                      'balance_sheet': balance}})
+    frame = store.frame('AAA')
+    # Each annual filing is only visible 90 days after its period end
+    assert frame.loc['2023-12-28', 'pe_ratio'] == pytest.approx(12.0)
+    assert frame.loc['2024-01-02', 'pe_ratio'] == pytest.approx(10.0)
+    assert frame.loc['2024-01-02', 'pb_ratio'] == pytest.approx(2.0)
+    assert frame.loc['2024-01-02', 'roe'] == pytest.approx(20.0)
@@ -0,0 +1,82 @@
+"""Tests for shrinkage covariance and portfolio weights."""
+import pytest
+import numpy as np
+import pandas as pd
+from value_analysis.portfolio import (PortfolioBuilder, ReturnMoments, min_variance_weights,
+                                      risk_contributions, risk_parity_weights)
+
+@pytest.fixture
+def sample_returns():
+    rng = np.random.default_rng(3)
+    factor = rng.normal(0, 0.01, (300, 1))
+    loadings = rng.uniform(0.5, 1.5, (1, 40))
+    data = factor * loadings + rng.normal(0, 0.02, (300, 40)) * rng.uniform(0.5, 2, 40)
+    return pd.DataFrame(data, columns=[f'S{i}' for i in range(40)])
+
+def _reference_ledoit_wolf(X):
+    n, p = X.shape
+    X = X - X.mean(axis=0)
+    emp_cov = X.T @ X / n
+    mu = np.trace(emp_cov) / p
+    X2 = X ** 2
+    delta_ = np.sum((X.T @ X) ** 2) / n ** 2
+    beta = (np.sum(X2.T @ X2) / n - delta_) / (p * n)
+    delta = (delta_ - 2 * mu * np.trace(emp_cov) + p * mu ** 2) / p
+    shrinkage = min(beta, delta) / delta
+    return (1 - shrinkage) * emp_cov + shrinkage * mu * np.eye(p), shrinkage
+
+def test_ledoit_wolf_matches_reference(sample_returns):
+    expected, expected_shrinkage = _reference_ledoit_wolf(sample_returns.to_numpy())
+    cov, shrinkage = ReturnMoments.from_returns(sample_returns.to_numpy(), block_size=7).ledoit_wolf()
+    assert shrinkage == pytest.approx(expected_shrinkage)
+    np.testing.assert_allclose(cov, expected, rtol=1e-8, atol=1e-14)
+
+def test_incremental_update_matches_batch(sample_returns):
+    builder = PortfolioBuilder(sample_returns.iloc[:250], window=200)
+    for _, day in sample_returns.iloc[250:].iterrows():
+        builder.update(day)
+    batch = PortfolioBuilder(sample_returns.iloc[-200:])
+    np.testing.assert_allclose(builder.covariance(), batch.covariance(), rtol=1e-8, atol=1e-14)
+
+def test_min_variance_weights(sample_returns):
+    cov, _ = ReturnMoments.from_returns(sample_returns.to_numpy()).ledoit_wolf()
+    weights = min_variance_weights(cov)
+    assert weights.sum() == pytest.approx(1.0)
+    assert (weights >= 0).all()
+    equal = np.full(len(weights), 1 / len(weights))
+    assert weights @ cov @ weights < equal @ cov @ equal
+
+def test_risk_parity_equalizes_contributions(sample_returns):
+    cov, _ = ReturnMoments.from_returns(sample_returns.to_numpy()).ledoit_wolf()
+    weights = risk_parity_weights(cov)
+    assert weights.sum() == pytest.approx(1.0)
+    np.testing.assert_allclose(risk_contributions(weights, cov), 1 / len(weights), rtol=1e-6)
+
+def test_from_screen():
+    index = pd.bdate_range('2023-01-02', periods=60)
+    rng = np.random.default_rng(0)
+    prices = {symbol: pd.DataFrame({'Close': 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 60)))},
+                                   index=index) for symbol in ['AAA', 'BBB', 'CCC']}
+    screen = pd.DataFrame({'Symbol': ['AAA', 'CCC', 'ZZZ']})
+    builder = PortfolioBuilder.from_screen(screen, prices)
+    assert list(builder.risk_parity().index) == ['AAA', 'CCC']
+
+def test_short_history_uses_common_days():
+    rng = np.random.default_rng(1)
+    returns = pd.DataFrame(rng.normal(0, 0.02, (500, 5)), columns=list('ABCDE'))
+    returns.iloc[:450, 4] = np.nan
+    builder = PortfolioBuilder(returns)
+    variances = np.diag(builder.covariance())
+    assert variances[4] == pytest.approx(0.02 ** 2, rel=0.5)
+    assert builder.min_variance()['E'] < 0.4
+
+def test_insufficient_history_raises(sample_returns):
+    returns = sample_returns.copy()
+    returns.iloc[:-10, 0] = np.nan
+    with pytest.raises(ValueError, match='S0'):
+        PortfolioBuilder(returns)
+    builder = PortfolioBuilder(sample_returns)
+    day = sample_returns.iloc[0].copy()
+    day.iloc[3] = np.nan
+    with pytest.raises(ValueError):
+        builder.update(day)
@@ -0,0 +1,84 @@
+"""Tests for cross-sectional factor ranking."""
+import pytest
+import numpy as np
+import pandas as pd
+from value_analysis.screener import ValueScreener, rank_universe
+
+@pytest.fixture
+def sample_metrics():
+    return pd.DataFrame({
+        'Symbol': ['CHEAP', 'MID', 'RICH', 'BANK1', 'BANK2'],
+        'Sector': ['Tech', 'Tech', 'Tech', 'Financials', 'Financials'],
+        'P/E Ratio': [8.0, 15.0, 40.0, 9.0, -5.0],
+        'P/B Ratio': [1.0, 3.0, 10.0, 0.8, 1.2],
+        'ROE': [0.25, 0.15, 0.10, 0.12, 0.02],
+        'Debt/Equity': [0.2, 0.5, 1.5, 3.0, 4.0]
+    })
+
+def test_percentiles_within_sector(sample_metrics):
+    ranked = rank_universe(sample_metrics).set_index('Symbol')
+    assert ranked.loc['CHEAP', 'earnings_yield_pct'] == pytest.approx(100.0)
+    assert ranked.loc['RICH', 'earnings_yield_pct'] == pytest.approx(100 / 3)
+    assert ranked.loc['BANK1', 'leverage_pct'] == pytest.approx(100.0)
+    assert np.isnan(ranked.loc['BANK2', 'earnings_yield_z'])
+
+def test_composite_order_and_top_n(sample_metrics):
+    ranked = rank_universe(sample_metrics)
+    assert ranked['Symbol'].iloc[0] in ('CHEAP', 'BANK1')
+    assert ranked['Symbol'].iloc[-1] == 'RICH'
+    top = rank_universe(sample_metrics, top_n=2)
+    assert top['Symbol'].tolist() == ranked['Symbol'].iloc[:2].tolist()
+
+def test_scales_to_large_universe():
+    rng = np.random.default_rng(0)
+    n = 50_000
+    metrics = pd.DataFrame({
+        'Symbol': np.arange(n).astype(str),
+        'Sector': rng.choice(['A', 'B', 'C', 'D'], n),
+        'P/E Ratio': rng.lognormal(2.8, 0.5, n),
+        'P/B Ratio': rng.lognormal(0.8, 0.6, n),
+        'ROE': rng.normal(0.14, 0.08, n),
+        'Debt/Equity': rng.lognormal(-0.7, 0.8, n)
+    })
+    top = rank_universe(metrics, top_n=100)
+    assert len(top) == 100
+    assert top['Composite Score'].is_monotonic_decreasing
+
+def test_infinite_ratio_does_not_break_group(sample_metrics):
+    sample_metrics.loc[2, 'Debt/Equity'] = np.inf
+    ranked = rank_universe(sample_metrics).set_index('Symbol')
+    assert np.isnan(ranked.loc['RICH', 'leverage_z'])
+    assert ranked.loc[['CHEAP', 'MID'], 'leverage_z'].notna().all()
+
+def test_rank_analyses_from_analyzer(mocker):
+    statements = {
+        'GOOD': (1.5, 80000, 100000),
+        'OKAY': (1.0, 90000, 100000),
+        'BROKE': (0.5, 90000, 0)
+    }
+    def financials(symbol, quarterly=False):
+        eps, debt, equity = statements[symbol]
+        return {
+            'income_statement': pd.DataFrame({
+                'Total Revenue': [100000, 90000], 'Cost of Revenue': [60000, 55000],
+                'Operating Income': [20000, 18000], 'Net Income': [15000, 13000],
+                'EPS': [eps, 1.0]
+            }),
+            'balance_sheet': pd.DataFrame({
+                'Total Assets': [200000, 180000], 'Inventory': [10000, 9000],
+                'Total Debt': [debt, debt], 'Total Stockholder Equity': [equity, equity],
+                'Book Value per Share': [12, 11]
+            })
+        }
+    mocker.patch('value_analysis.data_source.DataSource.get_financial_statements',
+                 side_effect=financials)
+    mocker.patch('value_analysis.data_source.DataSource.get_latest_price', return_value=30.0)
+
+    screener = ValueScreener()
+    analyses = {symbol: screener.analyzer.analyze_stock(symbol) for symbol in statements}
+    assert analyses['BROKE']['fundamental_metrics']['debt_to_equity'] == np.inf
+    ranked = screener.rank_analyses(analyses)
+    assert ranked['Symbol'].tolist()[0] == 'GOOD'
+    assert ranked['leverage_z'].notna().sum() == 2
+    assert ranked['Composite Score'].notna().all()
+    assert screener.rank_analyses(analyses, top_n=1)['Symbol'].tolist() == ['GOOD']
@@ -0,0 +1,72 @@
+"""Tests for as-of screening and historical screen replay."""
+import pytest
+import numpy as np
+import pandas as pd
+from value_analysis.point_in_time import PointInTimeStore
+from value_analysis.replay import ScreenReplay, rebalance_dates, screen_as_of
+
+@pytest.fixture
+def sample_store():
+    dates = pd.bdate_range('2023-01-02', '2023-04-28')
+    closes = {'CHEAP': np.linspace(10, 13, len(dates)),
+              'DEAR': np.linspace(50, 45, len(dates)),
+              'LATE': np.linspace(20, 22, len(dates))}
+    prices = pd.concat([pd.DataFrame({'Date': dates, 'Symbol': symbol, 'Close': close})
+                        for symbol, close in closes.items()], ignore_index=True)
+    fundamentals = pd.DataFrame({
+        'Symbol': ['CHEAP', 'DEAR', 'LATE', 'LATE'],
+        'Filing Date': pd.to_datetime(['2022-12-01', '2022-12-01', '2022-12-01', '2023-02-15']),
+        'EPS': [1.0, 1.0, 0.5, 2.0],
+        'Book Value per Share': [8.0, 10.0, 10.0, 15.0],
+        'Net Income': [150.0, 100.0, 50.0, 200.0],
+        'Total Stockholder Equity': [1000.0, 1000.0, 1000.0, 1000.0]
+    })
+    return PointInTimeStore(prices, fundamentals)
+
+def test_screen_as_of_uses_known_filings(sample_store):
+    criteria = {'max_pe': 15, 'min_roe': 10}
+    assert list(screen_as_of(sample_store, '2023-01-31', criteria).index) == ['CHEAP']
+    assert list(screen_as_of(sample_store, '2023-03-31', criteria).index) == ['CHEAP', 'LATE']
+    with pytest.raises(ValueError):
+        screen_as_of(sample_store, '2023-03-31', {'min_revenue_growth': 0.1})
+
+def test_rebalance_dates_are_month_ends(sample_store):
+    dates = rebalance_dates(sample_store)
+    assert list(dates.strftime('%Y-%m-%d')) == ['2023-01-31', '2023-02-28', '2023-03-31', '2023-04-28']
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_replay_turnover_and_forward_returns(sample_store, max_workers):
+    replay = ScreenReplay(sample_store, {'max_pe': 15, 'min_roe': 10}, max_workers=max_workers)
+    results = replay.run()
+    assert results['count'].tolist() == [1, 2, 2, 2]
+    assert results['turnover'].iloc[1:].tolist() == [0.5, 0.0, 0.0]
+    expected = sample_store.lookup('pe_ratio', ['2023-02-28'], ['CHEAP'])[0] / \
+        sample_store.lookup('pe_ratio', ['2023-01-31'], ['CHEAP'])[0] - 1
+    assert results['forward_return'].iloc[0] == pytest.approx(expected)
+    assert np.isnan(results['forward_return'].iloc[-1])
+
+    summary = replay.summary()
+    assert summary['periods'] == 4
+    assert summary['hit_rate'] == pytest.approx(1.0)
+
+def test_delisted_pick_exits_at_last_close():
+    live = pd.bdate_range('2023-01-02', '2023-02-28')
+    gone = pd.bdate_range('2023-01-02', '2023-02-10')
+    prices = pd.DataFrame({
+        'Date': list(live) + list(gone),
+        'Symbol': ['LIVE'] * len(live) + ['GONE'] * len(gone),
+        'Close': [10.0] * 42 + [20.0] * 29 + [2.0]
+    })
+    fundamentals = pd.DataFrame({
+        'Symbol': ['LIVE', 'GONE'],
+        'Filing Date': pd.to_datetime(['2022-12-01', '2022-12-01']),
+        'EPS': [1.0, 2.0],
+        'Book Value per Share': [10.0, 10.0],
+        'Net Income': [100.0, 100.0],
+        'Total Stockholder Equity': [1000.0, 1000.0]
+    })
+    store = PointInTimeStore(prices, fundamentals)
+    results = ScreenReplay(store, {'max_pe': 15}, max_workers=1).run()
+    assert sorted(results['members'].iloc[0]) == ['GONE', 'LIVE']
+    assert results['forward_return'].iloc[0] == pytest.approx((0.0 - 0.9) / 2)
+    assert results['hit_rate'].iloc[0] == 0.0
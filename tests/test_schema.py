@@ -0,0 +1,53 @@
+"""Tests for reduced-memory frame schemas."""
+import pytest
+import numpy as np
+import pandas as pd
+from value_analysis.schema import (optimize_metrics, optimize_prices, read_prices_csv,
+                                   read_metrics_csv, build_price_panel, memory_report)
+
+@pytest.fixture
+def sample_prices():
+    index = pd.bdate_range('2020-01-01', periods=500, name='Date')
+    close = np.linspace(10.0, 20.0, 500)
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': np.full(500, 1_000_000.0), 'Dividends': 0.0, 'Stock Splits': 0.0
+    }, index=index)
+
+def test_optimize_prices_drops_unused_columns(sample_prices):
+    prices = optimize_prices(sample_prices)
+    assert list(prices.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+    assert prices['Close'].dtype == np.float32
+    assert prices['Volume'].dtype == np.uint32
+    assert prices['Close'].iloc[-1] == pytest.approx(20.0)
+
+def test_optimize_metrics_uses_categorical_symbols():
+    metrics = optimize_metrics(pd.DataFrame({
+        'Symbol': ['AAPL', 'KO'], 'P/E Ratio': [25.1, 22.3], 'ROE': [1.5, 0.4]
+    }))
+    assert isinstance(metrics['Symbol'].dtype, pd.CategoricalDtype)
+    assert metrics['P/E Ratio'].dtype == np.float32
+
+def test_read_prices_csv(sample_prices, tmp_path):
+    path = tmp_path / 'historical_TEST.csv'
+    sample_prices.to_csv(path)
+    prices = read_prices_csv(str(path))
+    assert 'Dividends' not in prices.columns
+    assert isinstance(prices.index, pd.DatetimeIndex)
+
+def test_read_metrics_csv(tmp_path):
+    path = tmp_path / 'value_metrics.csv'
+    pd.DataFrame({'Symbol': ['AAPL', 'KO'], 'P/E Ratio': [25.123456789, 22.3]}).to_csv(path, index=False)
+    metrics = read_metrics_csv(str(path))
+    assert isinstance(metrics['Symbol'].dtype, pd.CategoricalDtype)
+    assert metrics['P/E Ratio'].dtype == np.float32
+    # The file on disk keeps full precision
+    assert pd.read_csv(path)['P/E Ratio'].iloc[0] == 25.123456789
+
+def test_panel_memory_at_least_halved(sample_prices):
+    data = {f'T{i}': sample_prices for i in range(20)}
+    baseline = pd.concat([frame.assign(Symbol=symbol) for symbol, frame in data.items()])
+    panel = build_price_panel(data)
+    report = memory_report(panel, baseline=baseline)
+    assert report.loc['Total', 'ratio'] <= 0.5
+    assert list(panel['Symbol'].cat.categories) == list(data)
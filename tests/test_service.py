@@ -0,0 +1,98 @@
+"""Tests for the long-running screening service."""
+import json
+import threading
+from urllib.error import HTTPError
+from urllib.request import urlopen
+import pytest
+from value_analysis.cache import AnalysisCache
+from value_analysis.data_source import DataSource
+from value_analysis.screener import ValueScreener
+from value_analysis.service import ScreeningService, make_server
+
+class StubDataSource(DataSource):
+    def __init__(self, financials):
+        super().__init__()
+        self.financials = financials
+        self.calls = 0
+
+    def get_financial_statements(self, symbol):
+        self.calls += 1
+        if symbol != 'BIG':
+            return self.financials
+        # Twice the latest revenue and earnings, so BIG trades at half the P/E
+        income = self.financials['income_statement'].copy()
+        income.loc[0, ['Total Revenue', 'Net Income', 'EPS']] *= 2
+        return {'income_statement': income, 'balance_sheet': self.financials['balance_sheet']}
+
+    def get_latest_price(self, symbol):
+        return 30.0
+
+@pytest.fixture
+def service(sample_financials):
+    screener = ValueScreener()
+    screener.analyzer.data_source = StubDataSource(sample_financials)
+    service = ScreeningService(['BIG', 'SMALL'], screener=screener, refresh_interval=60)
+    service.start()
+    yield service
+    service.stop()
+
+def test_queries_use_warm_state(service):
+    source = service.screener.analyzer.data_source
+    assert source.calls == 2
+    results = service.screen({'max_pe': 15})
+    assert [row['Symbol'] for row in results] == ['BIG']
+    service.analyze('SMALL')
+    assert source.calls == 2
+
+def test_new_symbol_survives_refresh(service):
+    service.analyze('NEW')
+    service.refresh()
+    assert service.health()['symbols'] == 3
+    assert 'NEW' in service.symbols
+
+def test_symbol_added_during_refresh(service, mocker):
+    analyze_stock = service.screener.analyzer.analyze_stock
+    def analyze_during_refresh(symbol, **kwargs):
+        if symbol == 'BIG' and 'NEW' not in service.symbols:
+            service.analyze('NEW')
+        return analyze_stock(symbol, **kwargs)
+    mocker.patch.object(service.screener.analyzer, 'analyze_stock', side_effect=analyze_during_refresh)
+    service.refresh()
+    assert service.health()['symbols'] == 3
+    assert 'NEW' in [row['Symbol'] for row in service.screen({})]
+
+def test_refresh_picks_up_new_filings(sample_financials):
+    source = StubDataSource(sample_financials)
+    screener = ValueScreener(cache=AnalysisCache())
+    screener.analyzer.data_source = source
+    service = ScreeningService(['SMALL'], screener=screener)
+    service.refresh()
+    assert service.analyze('SMALL')['fundamental_metrics']['pe_ratio'] == pytest.approx(20.0)
+    # Between refreshes, queries reuse the cached statements
+    screener.analyzer.analyze_stock('SMALL')
+    assert source.calls == 1
+
+    restated = sample_financials['income_statement'].copy()
+    restated.loc[0, 'EPS'] = 3.0
+    source.financials = {**sample_financials, 'income_statement': restated}
+    service.refresh()
+    assert source.calls == 2
+    assert service.analyze('SMALL')['fundamental_metrics']['pe_ratio'] == pytest.approx(10.0)
+
+def test_http_endpoints(service):
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    try:
+        health = json.loads(urlopen(f'{base}/health').read())
+        assert health['symbols'] == 2
+        screen = json.loads(urlopen(f'{base}/screen?max_pe=25').read())
+        assert sorted(row['Symbol'] for row in screen) == ['BIG', 'SMALL']
+        analysis = json.loads(urlopen(f'{base}/analyze/small').read())
+        assert analysis['fundamental_metrics']['pe_ratio'] == pytest.approx(20.0)
+        with pytest.raises(HTTPError) as error:
+            urlopen(f'{base}/screen?max_p=25')
+        assert error.value.code == 400
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,47 @@
+"""Tests for chunked returns and drawdown computation."""
+import pytest
+import numpy as np
+import pandas as pd
+import analysis
+from value_analysis.streaming import calculate_returns_chunked, iter_csv_chunks, run_chunked
+
+@pytest.fixture
+def intraday_prices():
+    rng = np.random.default_rng(7)
+    index = pd.date_range('2019-11-20', periods=6000, freq='97min', name='Date')
+    close = pd.Series(50 * np.exp(np.cumsum(rng.normal(0, 0.003, len(index)))), index=index)
+    close[rng.random(len(index)) < 0.02] = np.nan
+    close.iloc[2000:2600] = np.nan
+    return pd.DataFrame({'Close': close})
+
+def _chunks(data, size):
+    return [data.iloc[i:i + size] for i in range(0, len(data), size)]
+
+@pytest.mark.parametrize('chunksize', [150, 1000, 10000])
+def test_returns_match_in_memory(intraday_prices, chunksize):
+    expected = analysis.calculate_returns(intraday_prices)
+    result = calculate_returns_chunked(_chunks(intraday_prices, chunksize))
+    for got, want in zip(result, expected):
+        pd.testing.assert_series_equal(got, want, check_names=False, check_freq=False)
+
+@pytest.mark.parametrize('chunksize', [150, 1000, 10000])
+def test_metrics_match_in_memory(intraday_prices, chunksize):
+    daily_returns = analysis.calculate_returns(intraday_prices)[0]
+    expected = analysis.calculate_metrics(daily_returns)
+    result = run_chunked(_chunks(intraday_prices, chunksize))
+    assert result['Max Drawdown'] == expected['Max Drawdown']
+    for key in ['Annual Return', 'Volatility', 'Sharpe Ratio']:
+        assert result[key] == pytest.approx(expected[key], rel=1e-12)
+
+def test_csv_chunks(intraday_prices, tmp_path):
+    path = tmp_path / 'historical_TEST.csv'
+    intraday_prices.to_csv(path)
+    expected = analysis.calculate_metrics(intraday_prices['Close'].pct_change())
+    result = analysis.calculate_metrics_chunked(str(path), chunksize=700)
+    assert result['Max Drawdown'] == pytest.approx(expected['Max Drawdown'])
+    assert sum(len(chunk) for chunk in iter_csv_chunks(str(path), 700)) == len(intraday_prices)
+
+def test_out_of_order_chunks_rejected(intraday_prices):
+    chunks = _chunks(intraday_prices, 1000)
+    with pytest.raises(ValueError):
+        run_chunked([chunks[1], chunks[0]])
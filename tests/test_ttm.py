@@ -0,0 +1,70 @@
+"""Tests for incremental trailing-twelve-month statements."""
+import pytest
+import pandas as pd
+from value_analysis.ttm import TTMTracker
+
+@pytest.fixture
+def quarterly():
+    index = pd.to_datetime(['2023-12-31', '2023-09-30', '2023-06-30', '2023-03-31', '2022-12-31'])
+    return {
+        'income_statement': pd.DataFrame({
+            'Total Revenue': [400.0, 300.0, 200.0, 100.0, 50.0],
+            'Operating Income': [40.0, 30.0, 20.0, 10.0, 5.0],
+            'Net Income': [20.0, 15.0, 10.0, 5.0, 1.0],
+            'EPS': [0.4, 0.3, 0.2, 0.1, 0.05]
+        }, index=index),
+        'balance_sheet': pd.DataFrame({
+            'Total Debt': [500.0] * 5,
+            'Total Stockholder Equity': [1000.0] * 5,
+            'Book Value per Share': [20.0] * 5
+        }, index=index)
+    }
+
+def test_load_history_sums_latest_four_quarters(quarterly):
+    tracker = TTMTracker()
+    tracker.load_history('AAA', quarterly)
+    ttm = tracker.ttm('AAA')
+    assert ttm['Total Revenue'] == pytest.approx(1000.0)
+    assert ttm['EPS'] == pytest.approx(1.0)
+    ratios = tracker.ratios('AAA', 15.0)
+    assert ratios['pe_ratio'] == pytest.approx(15.0)
+    assert ratios['roe'] == pytest.approx(5.0)
+    assert ratios['operating_margin'] == pytest.approx(10.0)
+
+def test_new_filing_rolls_window(quarterly):
+    tracker = TTMTracker()
+    tracker.load_history('AAA', quarterly)
+    assert tracker.add_filing('AAA', '2024-03-31', {'Total Revenue': 500.0, 'EPS': 0.5},
+                              {'Total Stockholder Equity': 1200.0})
+    assert tracker.ttm('AAA')['Total Revenue'] == pytest.approx(1400.0)
+    assert tracker.period_end('AAA') == pd.Timestamp('2024-03-31')
+    statements = tracker.statements('AAA')
+    assert statements['balance_sheet']['Total Stockholder Equity'].iloc[0] == 1200.0
+
+def test_restatement_and_stale_filings(quarterly):
+    tracker = TTMTracker()
+    tracker.load_history('AAA', quarterly)
+    assert tracker.add_filing('AAA', '2023-12-31', {'Total Revenue': 450.0})
+    assert tracker.ttm('AAA')['Total Revenue'] == pytest.approx(1050.0)
+    assert not tracker.add_filing('AAA', '2023-06-30', {'Total Revenue': 1e9})
+    assert tracker.ttm('AAA')['Total Revenue'] == pytest.approx(1050.0)
+
+def test_unreported_items_stay_missing(quarterly):
+    tracker = TTMTracker()
+    tracker.load_history('AAA', quarterly)
+    tracker.add_filing('AAA', '2024-03-31', {'Total Revenue': 500.0, 'Net Income': 25.0})
+    ttm = tracker.ttm('AAA')
+    assert pd.isna(ttm['EPS'])
+    assert ttm['Net Income'] == pytest.approx(70.0)
+    for period_end in ['2024-06-30', '2024-09-30', '2024-12-31']:
+        tracker.add_filing('AAA', period_end, {'Total Revenue': 500.0, 'EPS': 0.5})
+    assert pd.isna(tracker.ttm('AAA')['EPS'])
+    tracker.add_filing('AAA', '2025-03-31', {'Total Revenue': 500.0, 'EPS': 0.5})
+    assert tracker.ttm('AAA')['EPS'] == pytest.approx(2.0)
+
+def test_requires_four_quarters():
+    tracker = TTMTracker()
+    tracker.add_filing('AAA', '2023-12-31', {'Total Revenue': 1.0})
+    assert 'AAA' not in tracker
+    with pytest.raises(KeyError):
+        tracker.ttm('AAA')
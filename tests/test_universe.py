@@ -0,0 +1,48 @@
+"""Tests for ticker universe normalization and validation."""
+import pytest
+import pandas as pd
+from value_analysis.universe import Universe, normalize_symbols, validate_ticker
+
+@pytest.fixture
+def master_file(tmp_path):
+    path = tmp_path / 'symbols.csv'
+    pd.DataFrame({
+        'Symbol': ['AAPL', 'BRK-B', 'KO', 'GOOGL'],
+        'Aliases': [None, 'BRK.B|BRKB', None, 'GOOG.L']
+    }).to_csv(path, index=False)
+    return str(path)
+
+def test_validate_ticker_accepts_share_classes():
+    assert validate_ticker('BRK-B')
+    assert validate_ticker('KO')
+    assert not validate_ticker('TOOLONG')
+    assert not validate_ticker('BRK.B')
+    assert not validate_ticker(None)
+
+def test_normalize_share_classes():
+    result = normalize_symbols(pd.Series([' brk.b', 'BF/B', 'aapl', '$KO']))
+    assert result.tolist() == ['BRK-B', 'BF-B', 'AAPL', 'KO']
+
+def test_universe_resolves_aliases(master_file):
+    universe = Universe.from_csv(master_file)
+    assert universe.filter(['brkb', 'BRK.B', 'AAPL', 'MSFT', 'goog.l']) == ['BRK-B', 'AAPL', 'GOOGL']
+    assert universe.invalid(['KO', 'MSFT', 42]) == ['MSFT', 42]
+
+def test_format_only_universe_and_cache():
+    universe = Universe()
+    symbols = ['AAPL', 'BRK-B', 'bad ticker', 'X' * 8]
+    first = universe.validate(symbols)
+    assert first['valid'].tolist() == [True, True, False, False]
+    universe.validate(symbols)
+    assert universe._validate_cached.cache_info().hits == 1
+
+def test_unhashable_inputs_are_invalid():
+    universe = Universe()
+    assert universe.filter([['A'], 'KO']) == ['KO']
+    assert universe.invalid([['A'], 'KO']) == [['A']]
+
+def test_resolve_single_symbol():
+    universe = Universe()
+    assert universe.resolve('brk.b') == 'BRK-B'
+    with pytest.raises(ValueError):
+        universe.resolve('NOT A TICKER')
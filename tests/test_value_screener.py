@@ -0,0 +1,22 @@
+"""Tests for the value screening script."""
+import pandas as pd
+import value_screener
+
+def test_scores_follow_tickers_when_performance_is_missing():
+    value_metrics = pd.DataFrame({
+        'Symbol': ['AAA', 'BBB', 'CCC'],
+        'P/E Ratio': [10.0, 30.0, 12.0],
+        'P/B Ratio': [1.0, 5.0, 2.0],
+        'Debt/Equity': [0.2, 2.0, 0.4],
+        'ROE': [0.2, 0.05, 0.1],
+        'Profit Margin': [0.2, 0.05, 0.15],
+        'Dividend Yield': [0.03, 0.0, 0.01]
+    })
+    performance_metrics = pd.DataFrame({
+        'Ticker': ['BBB', 'CCC'],
+        'Total Return': [0.1, 0.2]
+    })
+    final = value_screener.build_final_analysis(value_metrics, performance_metrics)
+    scores = dict(zip(final['Ticker'], final['Buffett Score']))
+    assert scores == {'BBB': 0, 'CCC': 4}
+    assert final.columns[-1] == 'Buffett Score'
@@ -1,5 +1,10 @@
 from .metrics import ValueMetrics
 from .data_source import DataSource
 from .backtesting import Backtester
+from .peers import PeerGroups
+from .point_in_time import PointInTimeStore
+from .portfolio import PortfolioBuilder
+from .replay import ScreenReplay
+from .cache import AnalysisCache
 
 __version__ = '0.1.0'
\ No newline at end of file
@@ -4,40 +4,132 @@ import pandas as pd
 import numpy as np
 from .metrics import ValueMetrics
 from .data_source import DataSource
+from .peers import PeerGroups
+from .ttm import TTMTracker
+from .cache import AnalysisCache, statement_version
+
+# Part of every cache key; bump when the analysis logic changes
+ANALYSIS_VERSION = '1'
 
 class ValueAnalyzer:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, peer_groups: Optional[PeerGroups] = None,
+                 ttm: Optional[TTMTracker] = None, cache: Optional[AnalysisCache] = None):
         self.data_source = DataSource(api_key)
-        self.metrics = None
+        self.peer_groups = peer_groups
+        self.ttm = ttm if ttm is not None else TTMTracker()
+        self.cache = cache
+        self.metrics = ValueMetrics(pd.DataFrame())
+
+    def analyze_stock(self, symbol: str, years: int = 5, use_ttm: bool = False,
+                      revalidate: bool = False) -> Dict:
+        """Perform comprehensive value analysis on a stock.
+
+        With `use_ttm`, valuation and efficiency metrics use trailing-twelve-month
+        figures; growth and competitive metrics still use annual statements.
+        With a cache, everything but the price-based ratios is reused while the
+        symbol's statement version is fresh. `revalidate` re-fetches the
+        statements first, so new or restated filings are picked up at once.
+        """
+        if self.cache is not None:
+            symbol = self.data_source.universe.resolve(symbol)
+        base = self._cached_analysis(symbol, years, use_ttm, revalidate)
+        latest_price = self.data_source.get_latest_price(symbol)
+        return self._apply_price(base, latest_price)
+    
+    def add_filing(self, symbol: str, period_end, income: Dict,
+                   balance: Optional[Dict] = None) -> bool:
+        """Roll a new quarterly filing into the TTM tracker and drop the
+        symbol's cached analyses."""
+        symbol = self.data_source.universe.resolve(symbol)
+        changed = self.ttm.add_filing(symbol, period_end, income, balance)
+        if changed and self.cache is not None:
+            self.cache.invalidate(symbol)
+        return changed
+    
+    def _cached_analysis(self, symbol: str, years: int, use_ttm: bool,
+                         revalidate: bool) -> Dict:
+        """Price-independent analysis, looked up by statement version before fetching.
 
-    def analyze_stock(self, symbol: str, years: int = 5) -> Dict:
-        """Perform comprehensive value analysis on a stock."""
-        # Get financial data
+        Statements are only fetched when the version is unknown, older than the
+        cache's `version_ttl`, or `revalidate` is set; unchanged statements
+        still reuse the cached result.
+        """
+        if self.cache is None:
+            return self._price_independent_analysis(
+                symbol, self.data_source.get_financial_statements(symbol), use_ttm)
+        
+        version = None if revalidate else self.cache.version(symbol)
+        if version is not None:
+            base = self.cache.get(symbol, self._cache_key(symbol, version, years, use_ttm))
+            if base is not None:
+                return base
+        
         financials = self.data_source.get_financial_statements(symbol)
+        version = statement_version(financials)
+        self.cache.set_version(symbol, version)
+        base = self.cache.get(symbol, self._cache_key(symbol, version, years, use_ttm))
+        if base is None:
+            base = self._price_independent_analysis(symbol, financials, use_ttm)
+            self.cache.put(symbol, self._cache_key(symbol, version, years, use_ttm), base)
+        return base
+    
+    def _cache_key(self, symbol: str, version: str, years: int, use_ttm: bool) -> tuple:
+        """Statement version plus the analyzer configuration that affects results."""
+        ttm_period = None
+        if use_ttm:
+            ttm_period = str(self.ttm.period_end(symbol)) if symbol in self.ttm else 'unseeded'
+        peers = self.peer_groups.get(symbol) if self.peer_groups is not None else None
+        return (ANALYSIS_VERSION, version, years, use_ttm, ttm_period,
+                tuple(sorted(peers.items())) if peers is not None else None)
+    
+    def _price_independent_analysis(self, symbol: str, financials: Dict[str, pd.DataFrame],
+                                    use_ttm: bool) -> Dict:
+        """Everything in the analysis that doesn't depend on the share price."""
+        latest = self._get_ttm_statements(symbol) if use_ttm else financials
         
         # Initialize metrics with income statement data
         self.metrics = ValueMetrics(financials['income_statement'])
         
-        # Calculate key metrics
-        analysis = {
+        return {
             'symbol': symbol,
-            'fundamental_metrics': self._calculate_fundamental_metrics(financials),
+            'fundamental_metrics': self._calculate_fundamental_metrics(latest),
             'growth_metrics': self._calculate_growth_metrics(financials),
-            'efficiency_metrics': self._calculate_efficiency_metrics(financials),
-            'competitive_analysis': self._analyze_competitive_position(financials)
+            'efficiency_metrics': self._calculate_efficiency_metrics(latest),
+            'competitive_analysis': self._analyze_competitive_position(symbol, financials)
         }
-        
-        return analysis
+    
+    def _apply_price(self, base: Dict, latest_price: float) -> Dict:
+        """Add P/E and P/B at the current price; copies so cached results stay intact."""
+        fundamentals = dict(base['fundamental_metrics'])
+        eps = fundamentals.pop('eps')
+        book_value = fundamentals.pop('book_value_per_share')
+        return {
+            'symbol': base['symbol'],
+            'fundamental_metrics': {
+                'pe_ratio': self.metrics.calculate_pe_ratio(latest_price, eps),
+                'pb_ratio': self.metrics.calculate_pb_ratio(latest_price, book_value),
+                **fundamentals
+            },
+            'growth_metrics': dict(base['growth_metrics']),
+            'efficiency_metrics': dict(base['efficiency_metrics']),
+            'competitive_analysis': dict(base['competitive_analysis'])
+        }
+    
+    def _get_ttm_statements(self, symbol: str) -> Dict[str, pd.DataFrame]:
+        """TTM statements, seeding the tracker from quarterly filings on first use."""
+        if symbol not in self.ttm:
+            quarterly = self.data_source.get_financial_statements(symbol, quarterly=True)
+            self.ttm.load_history(symbol, quarterly)
+        return self.ttm.statements(symbol)
     
     def _calculate_fundamental_metrics(self, financials: Dict[str, pd.DataFrame]) -> Dict:
-        """Calculate fundamental value metrics."""
-        latest_price = self.data_source.get_latest_price()
+        """Calculate fundamental value metrics; P/E and P/B are added at the current price."""
         latest_income = financials['income_statement'].iloc[0]
         latest_balance = financials['balance_sheet'].iloc[0]
         
         return {
-            'pe_ratio': self.metrics.calculate_pe_ratio(latest_price, latest_income['EPS']),
-            'pb_ratio': self.metrics.calculate_pb_ratio(latest_price, latest_balance['Book Value per Share']),
+            'eps': latest_income['EPS'],
+            'book_value_per_share': latest_balance['Book Value per Share'],
             'debt_to_equity': self.metrics.calculate_debt_to_equity(
                 latest_balance['Total Debt'],
                 latest_balance['Total Stockholder Equity']
@@ -75,19 +167,28 @@ class ValueAnalyzer:
             'inventory_turnover': latest_income['Cost of Revenue'] / latest_balance['Inventory']
         }
     
-    def _analyze_competitive_position(self, financials: Dict[str, pd.DataFrame]) -> Dict:
+    def _analyze_competitive_position(self, symbol: str, financials: Dict[str, pd.DataFrame]) -> Dict:
         """Analyze company's competitive position."""
         income_stmt = financials['income_statement']
         
         operating_margins = income_stmt['Operating Income'] / income_stmt['Total Revenue'] * 100
-        market_share = [0] # Would need industry data for actual market share
-        industry_margins = [0] # Would need industry data for comparison
+        peers = self.peer_groups.get(symbol) if self.peer_groups is not None else None
+        if peers is not None:
+            market_share = [peers['revenue_share'] * 100]
+            industry_margins = [peers['industry_median_margin']]
+        else:
+            market_share = [0] # Needs a PeerGroups universe for actual market share
+            industry_margins = [0] # Needs a PeerGroups universe for comparison
         
-        return self.metrics.assess_competitive_advantage(
+        assessment = self.metrics.assess_competitive_advantage(
             operating_margins.tolist(),
             market_share,
             industry_margins
         )
+        if peers is not None:
+            assessment['margin_percentile'] = peers['margin_percentile']
+            assessment['peer_count'] = peers['peer_count']
+        return assessment
     
     def _calculate_cagr(self, series: pd.Series) -> float:
         """Calculate Compound Annual Growth Rate."""
@@ -12,9 +12,8 @@ class Backtester:
         
     def run_backtest(self, strategy: callable, start_date: str, end_date: str) -> Dict:
         """Run backtest for a given strategy."""
-        portfolio = pd.DataFrame()
-        portfolio['cash'] = [self.initial_capital]
-        portfolio['equity'] = [0.0]
+        # (cash, shares, equity) per day; the frame is built once at the end
+        portfolio = [(self.initial_capital, 0.0, self.initial_capital)]
         
         # Filter data for backtest period
         mask = (self.data.index >= start_date) & (self.data.index <= end_date)
@@ -26,11 +25,21 @@ class Backtester:
             # Update portfolio
             self._update_portfolio(portfolio, signals, row)
             
+        portfolio = pd.DataFrame(portfolio, columns=['cash', 'shares', 'equity'])
         return self._calculate_performance_metrics(portfolio)
         
-    def _update_portfolio(self, portfolio: pd.DataFrame, signals: Dict, data: pd.Series) -> None:
+    def _update_portfolio(self, portfolio: List[tuple], signals: Dict, data: pd.Series) -> None:
         """Update portfolio based on strategy signals."""
-        pass  # Implementation details to be added
+        cash, shares, last_equity = portfolio[-1]
+        price = data['Close']
+        if not np.isfinite(price) or price <= 0:
+            portfolio.append((cash, shares, last_equity))
+            return
+        
+        equity = cash + shares * price
+        target = signals.get('position_size', 0.0) if signals.get('buy', False) else 0.0
+        shares = equity * target / price
+        portfolio.append((equity - shares * price, shares, equity))
         
     def _calculate_performance_metrics(self, portfolio: pd.DataFrame) -> Dict:
         """Calculate performance metrics for the backtest."""
@@ -39,4 +48,16 @@ class Backtester:
             'total_return': total_return,
             'max_drawdown': self._calculate_max_drawdown(portfolio),
             'sharpe_ratio': self._calculate_sharpe_ratio(portfolio)
-        }
\ No newline at end of file
+        }
+    
+    def _calculate_max_drawdown(self, portfolio: pd.DataFrame) -> float:
+        """Calculate the largest peak-to-trough decline in portfolio equity."""
+        equity = portfolio['equity']
+        return (equity / equity.cummax() - 1).min()
+    
+    def _calculate_sharpe_ratio(self, portfolio: pd.DataFrame) -> float:
+        """Calculate the annualized Sharpe ratio of daily equity returns."""
+        returns = portfolio['equity'].pct_change().dropna()
+        if len(returns) < 2 or returns.std() == 0:
+            return 0.0
+        return (returns.mean() * 252) / (returns.std() * np.sqrt(252))
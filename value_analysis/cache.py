@@ -0,0 +1,220 @@
+"""Memoization of analysis results keyed by statement version."""
+import hashlib
+import os
+import pickle
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import pandas as pd
+import numpy as np
+from .universe import validate_ticker
+
+def statement_version(statements: Dict[str, pd.DataFrame]) -> str:
+    """Content hash of a symbol's statements, so restatements change it too.
+
+    Statements are small, so hashing their raw values is much cheaper than
+    hash_pandas_object.
+    """
+    digest = hashlib.sha256()
+    for name in sorted(statements):
+        frame = statements[name]
+        digest.update(name.encode())
+        digest.update(repr((frame.index.tolist(), frame.columns.tolist())).encode())
+        try:
+            values = np.ascontiguousarray(frame.to_numpy(dtype=float))
+            digest.update(values.tobytes())
+        except (TypeError, ValueError):
+            digest.update(pickle.dumps(frame.to_numpy()))
+    return digest.hexdigest()
+
+class AnalysisCache:
+    def __init__(self, maxsize: int = 1024, directory: Optional[str] = None,
+                 max_disk_entries: int = 10000, version_ttl: Optional[float] = 86400.0):
+        """Two-tier cache of price-independent analysis results.
+
+        Each symbol has a current statement version; results are stored under
+        keys that include it. A version is trusted for `version_ttl` seconds
+        after it was last checked against freshly fetched statements, after
+        which the caller re-fetches to detect new or restated filings.
+        Results live in an in-process LRU of `maxsize` entries and, when
+        `directory` is given, in pickle files shared by several worker
+        processes. The directory also holds each symbol's version, so
+        `invalidate` after a new filing reaches every process. The oldest
+        files are evicted beyond `max_disk_entries`.
+
+        Cached values are shared, not copied; callers must not mutate them.
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.version_ttl = version_ttl
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict = OrderedDict()
+        self._versions: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self._disk_entries: Optional[int] = None
+
+    def version(self, symbol: str) -> Optional[str]:
+        """Current statement version of a symbol, or None if unknown or due a recheck."""
+        stored = self._stored_version(symbol)
+        if stored is None:
+            return None
+        version, checked = stored
+        if self.version_ttl is not None and time.time() - checked > self.version_ttl:
+            return None
+        return version
+
+    def set_version(self, symbol: str, version: str) -> None:
+        """Record a symbol's freshly checked statement version, dropping
+        results for older versions."""
+        stored = self._stored_version(symbol)
+        if stored is not None and stored[0] != version:
+            self.invalidate(symbol)
+        if self.directory is None:
+            with self._lock:
+                self._versions[symbol] = (version, time.time())
+            return
+        # The file's modification time records when the version was checked
+        path = self._version_path(symbol)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(self._tmp_path(path), 'w') as f:
+            f.write(version)
+        os.replace(self._tmp_path(path), path)
+
+    def _stored_version(self, symbol: str) -> Optional[Tuple[str, float]]:
+        if self.directory is None:
+            return self._versions.get(symbol)
+        path = self._version_path(symbol)
+        try:
+            with open(path) as f:
+                return f.read(), os.path.getmtime(path)
+        except FileNotFoundError:
+            return None
+
+    def get(self, symbol: str, key: Hashable):
+        """Return the cached result, or None on a miss."""
+        with self._lock:
+            value = self._memory.get((symbol, key))
+            if value is not None:
+                self._memory.move_to_end((symbol, key))
+                self.hits += 1
+                return value
+
+        value = self._read(symbol, key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(symbol, key, value)
+        return value
+
+    def put(self, symbol: str, key: Hashable, value) -> None:
+        """Store a result in memory and, if configured, on disk."""
+        with self._lock:
+            self._remember(symbol, key, value)
+        self._write(symbol, key, value)
+
+    def invalidate(self, symbol: str) -> None:
+        """Drop a symbol's version and results, e.g. after a new filing."""
+        with self._lock:
+            for entry in [entry for entry in self._memory if entry[0] == symbol]:
+                del self._memory[entry]
+            self._versions.pop(symbol, None)
+            self._disk_entries = None
+        if self.directory is not None:
+            shutil.rmtree(self._symbol_dir(symbol), ignore_errors=True)
+
+    def clear(self) -> None:
+        """Drop every cached result from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._versions.clear()
+            self._disk_entries = None
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _remember(self, symbol: str, key: Hashable, value) -> None:
+        self._memory[(symbol, key)] = value
+        self._memory.move_to_end((symbol, key))
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _symbol_dir(self, symbol: str) -> str:
+        # Symbols become directory names, so only canonical tickers are accepted
+        if not validate_ticker(symbol):
+            raise ValueError(f"Invalid ticker: {symbol}")
+        return os.path.join(self.directory, symbol)
+
+    def _path(self, symbol: str, key: Hashable) -> str:
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self._symbol_dir(symbol), f'{name}.pkl')
+
+    def _version_path(self, symbol: str) -> str:
+        return os.path.join(self._symbol_dir(symbol), 'VERSION')
+
+    @staticmethod
+    def _tmp_path(path: str) -> str:
+        # Unique per writer so concurrent processes never interleave; the rename is atomic
+        return f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+    def _read(self, symbol: str, key: Hashable):
+        if self.directory is None:
+            return None
+        path = self._path(symbol, key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        try:
+            # Mark as recently used for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return value
+
+    def _write(self, symbol: str, key: Hashable, value) -> None:
+        if self.directory is None:
+            return
+        path = self._path(symbol, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(self._tmp_path(path), 'wb') as f:
+            pickle.dump(value, f)
+        os.replace(self._tmp_path(path), path)
+
+        with self._lock:
+            if self._disk_entries is None:
+                self._disk_entries = len(self._disk_files())
+            else:
+                self._disk_entries += 1
+            over = self._disk_entries > self.max_disk_entries
+        if over:
+            self._evict_disk()
+
+    def _disk_files(self):
+        files = []
+        for root, _, names in os.walk(self.directory):
+            files.extend(os.path.join(root, name) for name in names if name.endswith('.pkl'))
+        return files
+
+    def _evict_disk(self) -> None:
+        """Remove the least recently used files down to 90% of the limit."""
+        files = []
+        for path in self._disk_files():
+            try:
+                files.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                pass
+        files.sort()
+        excess = len(files) - int(self.max_disk_entries * 0.9)
+        for _, path in files[:max(excess, 0)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._disk_entries = len(files) - max(excess, 0)
@@ -1,25 +1,67 @@
 """Data source integration for financial data retrieval."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import pandas as pd
 import yfinance as yf
+from .http_client import AsyncHttpClient, fetch_price_histories
+from .universe import Universe, default_universe
 
 class DataSource:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, universe: Optional[Universe] = None):
         self.api_key = api_key
+        self.universe = universe or default_universe()
         
     def get_stock_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
         """Retrieve stock data from Yahoo Finance."""
+        symbol = self.universe.resolve(symbol)
         try:
             stock = yf.Ticker(symbol)
             data = stock.history(start=start_date, end=end_date)
             return data
         except Exception as e:
             raise Exception(f'Error fetching data for {symbol}: {str(e)}')
+    
+    def get_latest_price(self, symbol: str) -> float:
+        """Retrieve the most recent closing price."""
+        symbol = self.universe.resolve(symbol)
+        try:
+            history = yf.Ticker(symbol).history(period='5d')
+            return float(history['Close'].iloc[-1])
+        except Exception as e:
+            raise Exception(f'Error fetching latest price for {symbol}: {str(e)}')
+    
+    def get_bulk_stock_data(self, symbols: List[str], period: str = '5y',
+                            max_connections: int = 20) -> Dict[str, pd.DataFrame]:
+        """Retrieve price histories for many symbols over a shared connection pool.
+
+        When called from a thread with a running event loop (e.g. a notebook),
+        the fetch runs on its own loop in a worker thread; async callers can
+        `await fetch_price_histories` directly instead.
+        """
+        symbols = self.universe.filter(symbols)
+        async def fetch() -> Dict[str, pd.DataFrame]:
+            async with AsyncHttpClient(max_connections=max_connections,
+                                       max_keepalive_connections=max_connections) as client:
+                return await fetch_price_histories(symbols, period=period, client=client)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(fetch())
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, fetch()).result()
             
-    def get_financial_statements(self, symbol: str) -> Dict[str, pd.DataFrame]:
-        """Retrieve financial statements for a company."""
+    def get_financial_statements(self, symbol: str, quarterly: bool = False) -> Dict[str, pd.DataFrame]:
+        """Retrieve annual (or quarterly) financial statements for a company."""
+        symbol = self.universe.resolve(symbol)
         try:
             stock = yf.Ticker(symbol)
+            if quarterly:
+                return {
+                    'income_statement': stock.quarterly_financials,
+                    'balance_sheet': stock.quarterly_balance_sheet,
+                    'cash_flow': stock.quarterly_cashflow
+                }
             return {
                 'income_statement': stock.financials,
                 'balance_sheet': stock.balance_sheet,
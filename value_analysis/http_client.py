@@ -0,0 +1,126 @@
+"""Pooled asynchronous HTTP client for raw market data endpoints."""
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional
+import pandas as pd
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+YAHOO_BASE_URL = 'https://query1.finance.yahoo.com'
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; value-stocks-analysis)',
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+class AsyncHttpClient:
+    def __init__(self, base_url: str = YAHOO_BASE_URL, max_connections: int = 20,
+                 max_keepalive_connections: int = 20, keepalive_expiry: float = 30.0,
+                 http2: bool = True, timeout: float = 10.0,
+                 headers: Optional[Dict[str, str]] = None):
+        """Shared keep-alive connection pool for bulk downloads.
+
+        HTTP/2 is negotiated only when the optional `h2` package is installed.
+        Compressed responses are decoded transparently by httpx. Requests beyond
+        the pool size wait for a free connection rather than timing out.
+        """
+        self.base_url = base_url
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.timeout = httpx.Timeout(timeout, pool=None)
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> 'AsyncHttpClient':
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Create the underlying connection pool."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=self.limits,
+                http2=self.http2,
+                timeout=self.timeout,
+                headers=self.headers
+            )
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_json(self, path: str, params: Optional[Dict] = None) -> Dict:
+        """GET a JSON document over a pooled connection."""
+        if self._client is None:
+            await self.open()
+        response = await self._client.get(path, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_many(self, paths: Iterable[str], params: Optional[Dict] = None) -> List:
+        """GET several JSON documents concurrently; failures are returned as exceptions."""
+        tasks = [self.get_json(path, params) for path in paths]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+def parse_chart(payload: Dict) -> pd.DataFrame:
+    """Convert a Yahoo Finance chart response into an OHLCV DataFrame."""
+    chart = payload['chart']
+    if chart.get('error'):
+        raise ValueError(chart['error'].get('description', chart['error']))
+    result = chart['result'][0]
+    quote = result['indicators']['quote'][0]
+    timezone = result.get('meta', {}).get('exchangeTimezoneName', 'UTC')
+
+    index = pd.to_datetime(result.get('timestamp', []), unit='s', utc=True).tz_convert(timezone)
+    index.name = 'Date'
+    return pd.DataFrame({
+        'Open': quote.get('open', []),
+        'High': quote.get('high', []),
+        'Low': quote.get('low', []),
+        'Close': quote.get('close', []),
+        'Volume': quote.get('volume', [])
+    }, index=index, dtype=float)
+
+async def fetch_price_histories(symbols: List[str], period: str = '5y', interval: str = '1d',
+                                client: Optional[AsyncHttpClient] = None) -> Dict[str, pd.DataFrame]:
+    """Download price histories for many symbols over one shared connection pool.
+
+    Symbols that fail are logged and left out of the result.
+    """
+    owns_client = client is None
+    client = client or AsyncHttpClient()
+    try:
+        params = {'range': period, 'interval': interval}
+        paths = [f'/v8/finance/chart/{symbol}' for symbol in symbols]
+        payloads = await client.get_many(paths, params)
+    finally:
+        if owns_client:
+            await client.close()
+
+    data = {}
+    for symbol, payload in zip(symbols, payloads):
+        if isinstance(payload, Exception):
+            logger.error(f"Error fetching data for {symbol}: {str(payload)}")
+            continue
+        try:
+            data[symbol] = parse_chart(payload)
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"Error parsing data for {symbol}: {str(e)}")
+    return data
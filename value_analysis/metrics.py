@@ -1,5 +1,5 @@
 """Core value investing metrics implementation based on Warren Buffett's principles."""
-from typing import Dict, Union, Optional
+from typing import Dict, List, Union, Optional
 import pandas as pd
 import numpy as np
 
@@ -25,4 +25,43 @@ class ValueMetrics:
     def calculate_roe(self, net_income: float, avg_equity: float) -> float:
         if avg_equity <= 0:
             return 0.0
-        return (net_income / avg_equity) * 100
\ No newline at end of file
+        return (net_income / avg_equity) * 100
+        
+    def calculate_operating_margin(self, operating_income: float, revenue: float) -> float:
+        if revenue <= 0:
+            return 0.0
+        return (operating_income / revenue) * 100
+
+    def assess_competitive_advantage(self, operating_margins: List[float],
+                                     market_share: List[float],
+                                     industry_margins: List[float]) -> Dict:
+        """Assess economic moat from margin level, margin stability and market share."""
+        margins = np.asarray(operating_margins, dtype=float)
+        margins = margins[np.isfinite(margins)]
+        avg_margin = float(margins.mean()) if margins.size else 0.0
+        margin_stability = float(margins.std()) if margins.size > 1 else 0.0
+
+        industry = np.asarray(industry_margins, dtype=float)
+        industry = industry[np.isfinite(industry)]
+        industry_margin = float(industry.mean()) if industry.size else 0.0
+        margin_premium = avg_margin - industry_margin
+
+        shares = np.asarray(market_share, dtype=float)
+        shares = shares[np.isfinite(shares)]
+        latest_share = float(shares[-1]) if shares.size else 0.0
+
+        if margin_premium > 5 and margin_stability < 5:
+            assessment = 'Strong competitive advantage'
+        elif margin_premium > 0:
+            assessment = 'Moderate competitive advantage'
+        else:
+            assessment = 'No clear competitive advantage'
+
+        return {
+            'average_margin': avg_margin,
+            'margin_stability': margin_stability,
+            'industry_margin': industry_margin,
+            'margin_premium': margin_premium,
+            'market_share': latest_share,
+            'assessment': assessment
+        }
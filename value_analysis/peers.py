@@ -0,0 +1,71 @@
+"""Peer-group aggregation for sector and industry comparisons."""
+from typing import Dict, Optional
+import pandas as pd
+import numpy as np
+
+class PeerGroups:
+    def __init__(self, universe: pd.DataFrame, group_by: str = 'Sector'):
+        """Aggregate a universe with one row per symbol into peer-group statistics.
+
+        The universe needs `Symbol`, the `group_by` column, `Total Revenue` and
+        `Operating Income`. All groups are aggregated in a single pass and the
+        per-symbol results are cached for constant-time lookups.
+        """
+        if group_by not in universe.columns:
+            raise ValueError(f"Universe is missing group column: {group_by}")
+        self.group_by = group_by
+        self.aggregates = self._aggregate(universe)
+        self._by_symbol = self.aggregates.to_dict('index')
+        self._by_group = (
+            self.aggregates.groupby(group_by)
+            .agg(median_margin=('industry_median_margin', 'first'),
+                 total_revenue=('Total Revenue', 'sum'),
+                 peer_count=('Total Revenue', 'size'))
+            .to_dict('index')
+        )
+
+    @classmethod
+    def from_financials(cls, financials: Dict[str, Dict[str, pd.DataFrame]],
+                        groups: Dict[str, str], group_by: str = 'Sector') -> 'PeerGroups':
+        """Build peer groups from per-symbol financial statements."""
+        rows = []
+        for symbol, statements in financials.items():
+            if symbol not in groups:
+                continue
+            latest_income = statements['income_statement'].iloc[0]
+            rows.append({
+                'Symbol': symbol,
+                group_by: groups[symbol],
+                'Total Revenue': latest_income['Total Revenue'],
+                'Operating Income': latest_income['Operating Income']
+            })
+        return cls(pd.DataFrame(rows), group_by=group_by)
+
+    def _aggregate(self, universe: pd.DataFrame) -> pd.DataFrame:
+        """Compute margins, percentiles and revenue shares for every group at once."""
+        df = universe[['Symbol', self.group_by, 'Total Revenue', 'Operating Income']].copy()
+        df = df.drop_duplicates('Symbol', keep='first').set_index('Symbol')
+
+        revenue = df['Total Revenue'].astype(float)
+        df['operating_margin'] = (
+            df['Operating Income'].astype(float) / revenue.where(revenue > 0) * 100
+        )
+
+        grouped = df.groupby(self.group_by, sort=False)
+        df['industry_median_margin'] = grouped['operating_margin'].transform('median')
+        df['margin_percentile'] = grouped['operating_margin'].rank(pct=True) * 100
+        # Negative revenue counts as zero on both sides so shares sum to one
+        positive_revenue = revenue.clip(lower=0)
+        group_revenue = positive_revenue.groupby(df[self.group_by], sort=False).transform('sum')
+        df['revenue_share'] = positive_revenue / group_revenue.where(group_revenue > 0)
+        df['peer_count'] = grouped['Total Revenue'].transform('size')
+
+        return df.replace([np.inf, -np.inf], np.nan)
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Return cached peer statistics for a symbol, or None if it is not in the universe."""
+        return self._by_symbol.get(symbol)
+
+    def group_summary(self, group: str) -> Optional[Dict]:
+        """Return cached aggregate statistics for a sector or industry."""
+        return self._by_group.get(group)
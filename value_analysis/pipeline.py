@@ -0,0 +1,216 @@
+"""Dependency-aware incremental pipeline runner.
+
+Stages form a DAG and run either once per ticker or once over all tickers.
+Every task's inputs and output are content-hashed into a manifest, so a
+rerun only recomputes the tasks whose inputs changed, and a task whose
+output comes out identical stops the change from propagating further.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+Task = Tuple[str, Optional[str]]
+
+class Stage:
+    def __init__(self, name: str, func: Callable, deps: Sequence[str] = (),
+                 per_ticker: bool = True, key: Optional[Callable[[Optional[str]], Any]] = None,
+                 version: str = '1'):
+        """A pipeline step.
+
+        Per-ticker stages are called as `func(ticker, **deps)` with each
+        dependency's output for that ticker; aggregate stages are called as
+        `func(**deps)` with a {ticker: output} dict per per-ticker dependency.
+        `key` adds an external fingerprint (e.g. the fetch date) to the input
+        hash, and bumping `version` forces a recompute after code changes.
+        """
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.per_ticker = per_ticker
+        self.key = key
+        self.version = version
+
+def content_hash(value: Any) -> str:
+    """Stable hash of a stage output."""
+    digest = hashlib.sha256()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        if isinstance(value, pd.DataFrame):
+            schema = [(str(col), str(dtype)) for col, dtype in value.dtypes.items()]
+        else:
+            schema = [(str(value.name), str(value.dtype))]
+        digest.update(repr(schema).encode())
+    else:
+        digest.update(pickle.dumps(value))
+    return digest.hexdigest()
+
+class Pipeline:
+    def __init__(self, stages: List[Stage], tickers: List[str],
+                 state_dir: str = '.pipeline', max_workers: int = 4):
+        self.stages = {stage.name: stage for stage in stages}
+        for stage in stages:
+            for dep in stage.deps:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dep}")
+                if stage.per_ticker and not self.stages[dep].per_ticker:
+                    raise ValueError(f"Per-ticker stage {stage.name} cannot depend on aggregate {dep}")
+        self.tickers = list(tickers)
+        self.state_dir = state_dir
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+
+    def run(self, force: bool = False) -> Dict[str, List[Task]]:
+        """Run every out-of-date task, in parallel where dependencies allow.
+
+        Returns the tasks that ran, were skipped as up to date, or failed.
+        """
+        self._manifest = self._load_manifest()
+        self._hashes: Dict[Task, str] = {}
+        self._outputs: Dict[Task, Any] = {}
+        self._force = force
+        self.report = {'ran': [], 'skipped': [], 'failed': []}
+
+        deps = self._task_graph()
+        dependents: Dict[Task, List[Task]] = {task: [] for task in deps}
+        for task, task_deps in deps.items():
+            for dep in task_deps:
+                dependents[dep].append(task)
+        waiting = {task: set(task_deps) for task, task_deps in deps.items()}
+        blocked = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self._run_task, task): task
+                       for task, task_deps in waiting.items() if not task_deps}
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = futures.pop(future)
+                    ok = future.result()
+                    for child in dependents[task]:
+                        waiting[child].discard(task)
+                        # Per-ticker children need every dependency; aggregates just drop failed tickers
+                        if not ok and (child[1] is not None or task[1] is None):
+                            blocked.add(child)
+                        if not waiting[child]:
+                            if child in blocked:
+                                futures[pool.submit(self._fail, child)] = child
+                            else:
+                                futures[pool.submit(self._run_task, child)] = child
+
+        self._save_manifest()
+        return self.report
+
+    def _task_graph(self) -> Dict[Task, List[Task]]:
+        graph = {}
+        for stage in self.stages.values():
+            if stage.per_ticker:
+                for ticker in self.tickers:
+                    graph[(stage.name, ticker)] = [(dep, ticker) for dep in stage.deps]
+            else:
+                graph[(stage.name, None)] = [
+                    (dep, ticker) if self.stages[dep].per_ticker else (dep, None)
+                    for dep in stage.deps
+                    for ticker in (self.tickers if self.stages[dep].per_ticker else [None])
+                ]
+        return graph
+
+    def _fail(self, task: Task) -> bool:
+        with self._lock:
+            self.report['failed'].append(task)
+        return False
+
+    def _dep_items(self, stage: Stage, ticker: Optional[str]) -> Dict[str, List[Task]]:
+        items = {}
+        for dep in stage.deps:
+            if not self.stages[dep].per_ticker:
+                items[dep] = [(dep, None)]
+            elif stage.per_ticker:
+                items[dep] = [(dep, ticker)]
+            else:
+                items[dep] = [(dep, t) for t in self.tickers if (dep, t) in self._hashes]
+        return items
+
+    def _run_task(self, task: Task) -> bool:
+        stage_name, ticker = task
+        stage = self.stages[stage_name]
+        dep_items = self._dep_items(stage, ticker)
+        entry_key = f'{stage_name}/{ticker or "*"}'
+        input_hash = hashlib.sha256(json.dumps([
+            stage.version,
+            ticker,
+            repr(stage.key(ticker)) if stage.key else None,
+            {dep: [[t, self._hashes[(dep, t)]] for _, t in tasks] for dep, tasks in dep_items.items()}
+        ]).encode()).hexdigest()
+
+        entry = self._manifest.get(entry_key)
+        if (not self._force and entry and entry['input'] == input_hash
+                and os.path.exists(self._output_path(task))):
+            with self._lock:
+                self._hashes[task] = entry['output']
+                self.report['skipped'].append(task)
+            return True
+
+        try:
+            inputs = {}
+            for dep, tasks in dep_items.items():
+                if stage.per_ticker or not self.stages[dep].per_ticker:
+                    inputs[dep] = self._load_output(tasks[0])
+                else:
+                    inputs[dep] = {t: self._load_output((dep, t)) for _, t in tasks}
+            output = stage.func(ticker, **inputs) if stage.per_ticker else stage.func(**inputs)
+        except Exception as e:
+            logger.error(f"Stage {stage_name} failed for {ticker or 'all tickers'}: {str(e)}")
+            return self._fail(task)
+
+        output_hash = content_hash(output)
+        self._store_output(task, output)
+        with self._lock:
+            self._outputs[task] = output
+            self._hashes[task] = output_hash
+            self._manifest[entry_key] = {'input': input_hash, 'output': output_hash}
+            self.report['ran'].append(task)
+        return True
+
+    def _output_path(self, task: Task) -> str:
+        stage_name, ticker = task
+        return os.path.join(self.state_dir, stage_name, f'{ticker or "_all"}.pkl')
+
+    def _store_output(self, task: Task, output: Any) -> None:
+        path = self._output_path(task)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(output, f)
+        os.replace(path + '.tmp', path)
+
+    def _load_output(self, task: Task) -> Any:
+        if task in self._outputs:
+            return self._outputs[task]
+        with open(self._output_path(task), 'rb') as f:
+            output = pickle.load(f)
+        with self._lock:
+            self._outputs[task] = output
+        return output
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.state_dir, 'manifest.json')
+
+    def _load_manifest(self) -> Dict:
+        try:
+            with open(self._manifest_path()) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        os.makedirs(self.state_dir, exist_ok=True)
+        with open(self._manifest_path() + '.tmp', 'w') as f:
+            json.dump(self._manifest, f, indent=1, sort_keys=True)
+        os.replace(self._manifest_path() + '.tmp', self._manifest_path())
@@ -0,0 +1,166 @@
+"""Point-in-time fundamentals store for survivorship-free backtests."""
+from typing import Dict, Sequence
+import pandas as pd
+import numpy as np
+
+FIELDS = ('pe_ratio', 'pb_ratio', 'roe')
+
+class PointInTimeStore:
+    def __init__(self, prices: pd.DataFrame, fundamentals: pd.DataFrame,
+                 allow_same_day: bool = False):
+        """Join daily prices with the statement values known on each date.
+
+        `prices` is long format with `Date`, `Symbol` and `Close`. `fundamentals`
+        has `Symbol`, `Filing Date`, `EPS`, `Book Value per Share`, `Net Income`
+        and `Total Stockholder Equity`. A filing is only visible from the next
+        trading day unless `allow_same_day` is set.
+        """
+        self.allow_same_day = allow_same_day
+        panel = self._as_of_join(prices, fundamentals)
+        self._build_arrays(panel)
+
+    @classmethod
+    def from_statements(cls, prices: Dict[str, pd.DataFrame],
+                        financials: Dict[str, Dict[str, pd.DataFrame]],
+                        filing_lag: pd.Timedelta = pd.Timedelta(days=90)) -> 'PointInTimeStore':
+        """Build a store from DataSource price histories and financial statements.
+
+        Statements are indexed by period end, so the filing date is approximated
+        as the period end plus `filing_lag`. The default is conservative for
+        annual reports, which are often filed 60-90 days after year-end.
+        Statements may be laid out with periods as rows or, as yfinance returns
+        them, with periods as columns.
+        """
+        price_frames = []
+        for symbol, history in prices.items():
+            frame = pd.DataFrame({'Date': _naive_dates(history.index),
+                                  'Symbol': symbol,
+                                  'Close': history['Close'].to_numpy()})
+            price_frames.append(frame)
+
+        statement_frames = []
+        for symbol, statements in financials.items():
+            frame = _statement_fields(statements)
+            frame['Symbol'] = symbol
+            frame['Filing Date'] = _naive_dates(frame.index) + filing_lag
+            statement_frames.append(frame.reset_index(drop=True))
+
+        return cls(pd.concat(price_frames, ignore_index=True),
+                   pd.concat(statement_frames, ignore_index=True))
+
+    def _as_of_join(self, prices: pd.DataFrame, fundamentals: pd.DataFrame) -> pd.DataFrame:
+        """Attach the latest filing known on each price date and compute ratios."""
+        left = prices[['Date', 'Symbol', 'Close']].copy()
+        left['Date'] = pd.to_datetime(left['Date'])
+        right = fundamentals.copy()
+        right['Filing Date'] = pd.to_datetime(right['Filing Date'])
+
+        panel = pd.merge_asof(
+            left.sort_values('Date'),
+            right.sort_values('Filing Date'),
+            left_on='Date',
+            right_on='Filing Date',
+            by='Symbol',
+            direction='backward',
+            allow_exact_matches=self.allow_same_day
+        )
+
+        close = panel['Close'].to_numpy(dtype=float)
+        eps = panel['EPS'].to_numpy(dtype=float)
+        book = panel['Book Value per Share'].to_numpy(dtype=float)
+        income = panel['Net Income'].to_numpy(dtype=float)
+        equity = panel['Total Stockholder Equity'].to_numpy(dtype=float)
+
+        # Same conventions as ValueMetrics; NaN where no filing was known yet
+        with np.errstate(divide='ignore', invalid='ignore'):
+            panel['pe_ratio'] = np.where(eps > 0, close / eps, np.where(np.isnan(eps), np.nan, np.inf))
+            panel['pb_ratio'] = np.where(book > 0, close / book, np.where(np.isnan(book), np.nan, np.inf))
+            panel['roe'] = np.where(equity > 0, income / equity * 100, np.where(np.isnan(equity), np.nan, 0.0))
+        return panel
+
+    def _build_arrays(self, panel: pd.DataFrame) -> None:
+        """Pivot the joined panel into dense date x symbol arrays."""
+        self.dates = pd.DatetimeIndex(np.sort(panel['Date'].unique()))
+        self.symbols = pd.Index(np.sort(panel['Symbol'].unique()))
+        rows = self.dates.get_indexer(panel['Date'])
+        cols = self.symbols.get_indexer(panel['Symbol'])
+
+        shape = (len(self.dates), len(self.symbols))
+        self.close = np.full(shape, np.nan)
+        self.close[rows, cols] = panel['Close'].to_numpy(dtype=float)
+        self.arrays = {}
+        for field in FIELDS:
+            values = np.full(shape, np.nan)
+            values[rows, cols] = panel[field].to_numpy(dtype=float)
+            self.arrays[field] = values
+
+    def lookup(self, field: str, dates: Sequence, symbols: Sequence[str]) -> np.ndarray:
+        """Vectorized lookup of a ratio for paired dates and symbols.
+
+        Dates are matched to the most recent trading date on or before them;
+        unknown symbols or dates before the first trading day return NaN.
+        """
+        if field not in self.arrays:
+            raise ValueError(f"Unknown field: {field}")
+        rows = self.dates.get_indexer(pd.DatetimeIndex(dates), method='pad')
+        cols = self.symbols.get_indexer(pd.Index(symbols))
+        values = self.arrays[field][rows, cols]
+        return np.where((rows < 0) | (cols < 0), np.nan, values)
+
+    def cross_section(self, date) -> pd.DataFrame:
+        """Return every symbol's close and ratios as known on a date."""
+        row = self.dates.get_indexer(pd.DatetimeIndex([date]), method='pad')[0]
+        if row < 0:
+            return pd.DataFrame(columns=['Close', *FIELDS], index=self.symbols)
+        data = {'Close': self.close[row]}
+        data.update({field: self.arrays[field][row] for field in FIELDS})
+        return pd.DataFrame(data, index=self.symbols).dropna(subset=['Close'])
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        """Return a single symbol's daily close and ratios, e.g. for Backtester."""
+        col = self.symbols.get_loc(symbol)
+        data = {'Close': self.close[:, col]}
+        data.update({field: self.arrays[field][:, col] for field in FIELDS})
+        return pd.DataFrame(data, index=self.dates).dropna(subset=['Close'])
+
+# yfinance line item names for the fields the store needs
+_ALIASES = {
+    'EPS': ['Diluted EPS', 'Basic EPS'],
+    'Total Stockholder Equity': ['Stockholders Equity', 'Common Stock Equity'],
+    'Shares': ['Ordinary Shares Number', 'Share Issued']
+}
+
+def _periods_as_rows(statement: pd.DataFrame) -> pd.DataFrame:
+    """Transpose yfinance statements, which have one column per period."""
+    if isinstance(statement.columns, pd.DatetimeIndex):
+        return statement.T
+    return statement
+
+def _pick(frame: pd.DataFrame, field: str) -> pd.Series:
+    for name in [field, *_ALIASES.get(field, [])]:
+        if name in frame.columns:
+            return frame[name].astype(float)
+    return pd.Series(np.nan, index=frame.index)
+
+def _statement_fields(statements: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """EPS, book value per share, net income and equity by period end."""
+    income = _periods_as_rows(statements['income_statement'])
+    balance = _periods_as_rows(statements['balance_sheet'])
+    combined = income.join(balance, how='inner', rsuffix='_balance')
+    equity = _pick(combined, 'Total Stockholder Equity')
+    book = _pick(combined, 'Book Value per Share')
+    if book.isna().all():
+        book = equity / _pick(combined, 'Shares')
+    return pd.DataFrame({
+        'EPS': _pick(combined, 'EPS'),
+        'Book Value per Share': book,
+        'Net Income': _pick(combined, 'Net Income'),
+        'Total Stockholder Equity': equity
+    }, index=combined.index)
+
+def _naive_dates(index: pd.Index) -> pd.DatetimeIndex:
+    """Normalize an index to timezone-naive dates."""
+    dates = pd.DatetimeIndex(pd.to_datetime(index))
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    return dates.normalize()
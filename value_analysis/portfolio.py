@@ -0,0 +1,199 @@
+"""Portfolio construction from screen results using shrinkage covariance."""
+from collections import deque
+from typing import Dict, Optional, Tuple
+import pandas as pd
+import numpy as np
+
+class ReturnMoments:
+    def __init__(self, n_assets: int):
+        """Sufficient statistics of a returns window for Ledoit-Wolf shrinkage.
+
+        Keeps the count, first and second moments and the per-day squared
+        norms needed for the shrinkage intensity, so a day can be added or
+        removed with an O(p^2) rank-one update instead of a full recompute.
+        """
+        self.n = 0
+        self.sum = np.zeros(n_assets)
+        self.cross = np.zeros((n_assets, n_assets))
+        self.norm_weighted_sum = np.zeros(n_assets)
+        self.norm_sq_sum = 0.0
+        self.norm_sum = 0.0
+
+    @classmethod
+    def from_returns(cls, returns: np.ndarray, block_size: int = 256) -> 'ReturnMoments':
+        """Accumulate moments for a days x assets matrix in column blocks."""
+        returns = _complete(returns)
+        moments = cls(returns.shape[1])
+        moments.n = returns.shape[0]
+        moments.sum = returns.sum(axis=0)
+        # Blocked X^T X keeps BLAS working set bounded for large universes
+        for start in range(0, returns.shape[1], block_size):
+            stop = start + block_size
+            moments.cross[:, start:stop] = returns.T @ returns[:, start:stop]
+        norms = np.einsum('ij,ij->i', returns, returns)
+        moments.norm_weighted_sum = norms @ returns
+        moments.norm_sq_sum = float(norms @ norms)
+        moments.norm_sum = float(norms.sum())
+        return moments
+
+    def add(self, day: np.ndarray, sign: float = 1.0) -> None:
+        """Add (or with sign=-1 remove) a single day of returns."""
+        day = _complete(day)
+        norm = float(day @ day)
+        self.n += int(sign)
+        self.sum += sign * day
+        self.cross += sign * np.outer(day, day)
+        self.norm_weighted_sum += sign * norm * day
+        self.norm_sq_sum += sign * norm * norm
+        self.norm_sum += sign * norm
+
+    def remove(self, day: np.ndarray) -> None:
+        """Remove a single day of returns, e.g. when it leaves a rolling window."""
+        self.add(day, sign=-1.0)
+
+    def covariance(self) -> np.ndarray:
+        """Maximum-likelihood (1/n) sample covariance."""
+        mean = self.sum / self.n
+        return self.cross / self.n - np.outer(mean, mean)
+
+    def ledoit_wolf(self) -> Tuple[np.ndarray, float]:
+        """Ledoit-Wolf covariance shrunk towards a scaled identity, and the intensity."""
+        n, p = self.n, len(self.sum)
+        mean = self.sum / n
+        emp_cov = self.covariance()
+        trace = float(np.trace(emp_cov))
+        mu = trace / p
+
+        # Sum over days of the squared norm of each centered row, expanded in moments
+        mean_sq = float(mean @ mean)
+        fourth = (self.norm_sq_sum
+                  + 4 * float(mean @ self.cross @ mean)
+                  + n * mean_sq ** 2
+                  - 4 * float(self.norm_weighted_sum @ mean)
+                  + 2 * mean_sq * self.norm_sum
+                  - 4 * mean_sq * n * mean_sq)
+
+        frobenius = float(np.sum(emp_cov ** 2))
+        beta = (fourth / n - frobenius) / (p * n)
+        delta = (frobenius - 2 * mu * trace + p * mu ** 2) / p
+        beta = min(beta, delta)
+        shrinkage = 0.0 if beta <= 0 else beta / delta
+
+        shrunk = (1 - shrinkage) * emp_cov
+        shrunk.flat[::p + 1] += shrinkage * mu
+        return shrunk, shrinkage
+
+def _complete(returns) -> np.ndarray:
+    """Reject missing returns, which would otherwise read as 0% and understate variance."""
+    returns = np.asarray(returns, dtype=float)
+    if np.isnan(returns).any():
+        raise ValueError('Returns contain missing values; align histories first')
+    return returns
+
+def min_variance_weights(cov: np.ndarray, long_only: bool = True) -> np.ndarray:
+    """Global minimum-variance weights summing to one.
+
+    With `long_only`, assets with negative weights are dropped and the system
+    re-solved until all remaining weights are non-negative.
+    """
+    p = cov.shape[0]
+    active = np.ones(p, dtype=bool)
+    weights = np.zeros(p)
+    while active.any():
+        sub = np.linalg.solve(cov[np.ix_(active, active)], np.ones(active.sum()))
+        sub /= sub.sum()
+        if not long_only or (sub >= 0).all():
+            weights[:] = 0.0
+            weights[active] = sub
+            return weights
+        active[np.flatnonzero(active)[sub < 0]] = False
+    return weights
+
+def risk_parity_weights(cov: np.ndarray, tol: float = 1e-10, max_iter: int = 100) -> np.ndarray:
+    """Equal risk contribution weights by Newton's method.
+
+    Minimizes the convex function 1/2 y'Sy - b'log(y), whose minimizer has
+    y_i (Sy)_i = b_i for every asset, then normalizes to weights summing to one.
+    """
+    p = cov.shape[0]
+    budget = np.full(p, 1.0 / p)
+    y = 1.0 / np.sqrt(np.diag(cov))
+    y *= np.sqrt(budget.sum() / (y @ cov @ y))
+    for _ in range(max_iter):
+        gradient = cov @ y - budget / y
+        hessian = cov.copy()
+        hessian.flat[::p + 1] += budget / y ** 2
+        step = np.linalg.solve(hessian, gradient)
+        # Damp the step so weights stay strictly positive
+        scale = 1.0
+        shrink = step > 0
+        if shrink.any():
+            scale = min(1.0, 0.99 * np.min(y[shrink] / step[shrink]))
+        y -= scale * step
+        if np.abs(gradient).max() < tol:
+            break
+    return y / y.sum()
+
+def risk_contributions(weights: np.ndarray, cov: np.ndarray) -> np.ndarray:
+    """Fraction of portfolio variance contributed by each asset."""
+    marginal = weights * (cov @ weights)
+    return marginal / marginal.sum()
+
+class PortfolioBuilder:
+    def __init__(self, returns: pd.DataFrame, window: Optional[int] = None,
+                 block_size: int = 256, min_history: int = 20):
+        """Covariance and weights for a days x symbols returns panel.
+
+        Only days on which every symbol has a return are used, so all moments
+        come from a common history. A symbol with fewer than `min_history`
+        returns raises ValueError rather than shrinking that history. With
+        `window`, only the most recent `window` days are kept and each update
+        drops the oldest day.
+        """
+        counts = returns.notna().sum()
+        short = counts.index[counts < min_history].tolist()
+        if short:
+            raise ValueError(f"Fewer than {min_history} returns for {short}")
+        returns = returns.dropna()
+        if len(returns) < min_history:
+            raise ValueError(f"Only {len(returns)} days of common return history")
+        if window is not None:
+            returns = returns.iloc[-window:]
+        self.symbols = returns.columns
+        self.window = window
+        self._days = deque(returns.to_numpy(dtype=float))
+        self.moments = ReturnMoments.from_returns(returns.to_numpy(dtype=float), block_size)
+
+    @classmethod
+    def from_screen(cls, screen_results: pd.DataFrame, prices: Dict[str, pd.DataFrame],
+                    window: Optional[int] = None, min_history: int = 20) -> 'PortfolioBuilder':
+        """Build from ValueScreener output and per-symbol price histories."""
+        symbols = [symbol for symbol in screen_results['Symbol'] if symbol in prices]
+        if not symbols:
+            raise ValueError('No screened symbols have price data')
+        closes = pd.concat({symbol: prices[symbol]['Close'] for symbol in symbols}, axis=1)
+        returns = closes.pct_change(fill_method=None).iloc[1:]
+        return cls(returns, window=window, min_history=min_history)
+
+    def update(self, day_returns: pd.Series) -> None:
+        """Incorporate one new day of returns in O(p^2); every symbol needs a return."""
+        day = day_returns.reindex(self.symbols).to_numpy(dtype=float)
+        self.moments.add(day)
+        self._days.append(day)
+        if self.window is not None and len(self._days) > self.window:
+            self.moments.remove(self._days.popleft())
+
+    def covariance(self) -> pd.DataFrame:
+        """Ledoit-Wolf shrinkage covariance of the current window."""
+        cov, _ = self.moments.ledoit_wolf()
+        return pd.DataFrame(cov, index=self.symbols, columns=self.symbols)
+
+    def min_variance(self, long_only: bool = True) -> pd.Series:
+        """Minimum-variance weights from the shrinkage covariance."""
+        cov, _ = self.moments.ledoit_wolf()
+        return pd.Series(min_variance_weights(cov, long_only), index=self.symbols)
+
+    def risk_parity(self) -> pd.Series:
+        """Equal risk contribution weights from the shrinkage covariance."""
+        cov, _ = self.moments.ledoit_wolf()
+        return pd.Series(risk_parity_weights(cov), index=self.symbols)
@@ -0,0 +1,137 @@
+"""As-of screening and parallel historical replay of screen criteria."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+import pandas as pd
+import numpy as np
+from .point_in_time import PointInTimeStore
+
+# ValueScreener criteria keys that can be evaluated from point-in-time ratios
+CRITERIA_FIELDS = {
+    'max_pe': ('pe_ratio', 'max'),
+    'max_pb': ('pb_ratio', 'max'),
+    'min_roe': ('roe', 'min')
+}
+
+def screen_as_of(store: PointInTimeStore, date, criteria: Dict) -> pd.DataFrame:
+    """Screen every symbol using only the data known on `date`.
+
+    Uses the same criteria keys and comparisons as ValueScreener; keys that
+    the store has no point-in-time data for raise ValueError.
+    """
+    unsupported = set(criteria) - set(CRITERIA_FIELDS)
+    if unsupported:
+        raise ValueError(f"Criteria not available point-in-time: {sorted(unsupported)}")
+    section = store.cross_section(date)
+    mask = np.ones(len(section), dtype=bool)
+    for key, value in criteria.items():
+        field, bound = CRITERIA_FIELDS[key]
+        values = section[field].to_numpy(dtype=float)
+        mask &= (values <= value) if bound == 'max' else (values >= value)
+    return section[mask]
+
+def rebalance_dates(store: PointInTimeStore, freq: str = 'M',
+                    start=None, end=None) -> pd.DatetimeIndex:
+    """Last trading date of each period (month-end by default) in the store."""
+    dates = store.dates
+    if start is not None:
+        dates = dates[dates >= pd.Timestamp(start)]
+    if end is not None:
+        dates = dates[dates <= pd.Timestamp(end)]
+    last = pd.Series(dates, index=dates).groupby(dates.to_period(freq)).max()
+    return pd.DatetimeIndex(last.to_numpy())
+
+# Each worker process receives the store once rather than once per date
+_worker_store: Optional[PointInTimeStore] = None
+
+def _init_worker(store: PointInTimeStore) -> None:
+    global _worker_store
+    _worker_store = store
+
+def _evaluate(date: pd.Timestamp, next_date: Optional[pd.Timestamp], criteria: Dict,
+              store: Optional[PointInTimeStore] = None) -> Dict:
+    """Screen on one rebalance date and measure the picks' forward returns."""
+    store = store or _worker_store
+    members = screen_as_of(store, date, criteria).index
+    result = {'date': date, 'members': list(members), 'forward_return': np.nan,
+              'median_return': np.nan, 'hit_rate': np.nan, 'universe_return': np.nan}
+    if next_date is None:
+        return result
+
+    row = store.dates.get_indexer([date], method='pad')[0]
+    next_row = store.dates.get_indexer([next_date], method='pad')[0]
+    # Symbols that stop trading before the next date exit at their last close,
+    # so delistings count against the screen instead of dropping out
+    window = store.close[row:next_row + 1]
+    last = len(window) - 1 - np.argmax(~np.isnan(window[::-1]), axis=0)
+    exit_price = window[last, np.arange(window.shape[1])]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        forward = exit_price / store.close[row] - 1
+    forward = np.where(np.isfinite(forward), forward, np.nan)
+    picks = forward[store.symbols.get_indexer(members)]
+    picks = picks[~np.isnan(picks)]
+    universe = forward[~np.isnan(forward)]
+    result.update({
+        'forward_return': picks.mean() if len(picks) else np.nan,
+        'median_return': np.median(picks) if len(picks) else np.nan,
+        'hit_rate': (picks > 0).mean() if len(picks) else np.nan,
+        'universe_return': universe.mean() if len(universe) else np.nan
+    })
+    return result
+
+class ScreenReplay:
+    def __init__(self, store: PointInTimeStore, criteria: Dict,
+                 dates: Optional[Sequence] = None, max_workers: Optional[int] = None):
+        """Replay a screen at each rebalance date.
+
+        `dates` defaults to every month-end in the store. Dates are evaluated
+        in parallel worker processes; `max_workers=1` runs in-process.
+        """
+        self.store = store
+        self.criteria = dict(criteria)
+        self.dates = pd.DatetimeIndex(dates) if dates is not None else rebalance_dates(store)
+        self.max_workers = max_workers
+
+    def run(self) -> pd.DataFrame:
+        """One row per rebalance date with members, turnover and forward returns."""
+        dates = list(self.dates)
+        next_dates = dates[1:] + [None]
+        criteria = [self.criteria] * len(dates)
+        if self.max_workers == 1:
+            rows = [_evaluate(date, next_date, self.criteria, self.store)
+                    for date, next_date in zip(dates, next_dates)]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                     initargs=(self.store,)) as pool:
+                workers = self.max_workers or os.cpu_count() or 1
+                chunksize = max(1, len(dates) // (4 * workers))
+                rows = list(pool.map(_evaluate, dates, next_dates, criteria, chunksize=chunksize))
+
+        results = pd.DataFrame(rows).set_index('date')
+        results['count'] = results['members'].map(len)
+        results['turnover'] = _turnover(results['members'].tolist())
+        results['excess_return'] = results['forward_return'] - results['universe_return']
+        self.results = results
+        return results
+
+    def summary(self) -> Dict[str, float]:
+        """Average membership, turnover and forward-return statistics over the replay."""
+        results = self.results
+        forward = results['forward_return'].dropna()
+        return {
+            'periods': len(results),
+            'average_count': results['count'].mean(),
+            'average_turnover': results['turnover'].mean(),
+            'mean_forward_return': forward.mean(),
+            'forward_return_volatility': forward.std(),
+            'hit_rate': results['hit_rate'].mean(),
+            'mean_excess_return': results['excess_return'].mean()
+        }
+
+def _turnover(memberships: List[List[str]]) -> List[float]:
+    """Fraction of each period's members that were not held in the previous period."""
+    turnover = [np.nan]
+    for previous, current in zip(memberships, memberships[1:]):
+        current = set(current)
+        turnover.append(len(current - set(previous)) / len(current) if current else 0.0)
+    return turnover[:len(memberships)]
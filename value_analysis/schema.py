@@ -0,0 +1,102 @@
+"""Reduced-memory dtype schemas for metrics and price frames."""
+from typing import Dict, Iterable, Optional
+import pandas as pd
+
+# Ratios are reported to a few significant digits, so float32 loses nothing
+METRICS_SCHEMA = {
+    'Symbol': 'category',
+    'Ticker': 'category',
+    'Sector': 'category',
+    'Industry': 'category',
+    'P/E Ratio': 'float32',
+    'P/B Ratio': 'float32',
+    'Debt/Equity': 'float32',
+    'ROE': 'float32',
+    'Profit Margin': 'float32',
+    'Dividend Yield': 'float32'
+}
+
+# float32 keeps cent precision for prices below ~100,000
+PRICE_SCHEMA = {
+    'Symbol': 'category',
+    'Open': 'float32',
+    'High': 'float32',
+    'Low': 'float32',
+    'Close': 'float32',
+    'Volume': 'unsigned'
+}
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str],
+                 columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Cast columns to their schema dtypes, keeping only `columns` if given.
+
+    The special dtype 'unsigned' downcasts to the smallest unsigned integer
+    that fits, falling back to float32 when the column has missing values.
+    """
+    if columns is not None:
+        keep = [col for col in df.columns if col in set(columns)]
+        df = df[keep]
+    df = df.copy()
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        if dtype == 'unsigned':
+            if df[col].isnull().any() or (df[col] < 0).any():
+                df[col] = df[col].astype('float32')
+            else:
+                df[col] = pd.to_numeric(df[col].astype('int64'), downcast='unsigned')
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+def optimize_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply the metrics schema to a value metrics frame."""
+    return apply_schema(df, METRICS_SCHEMA)
+
+def optimize_prices(df: pd.DataFrame, columns: Iterable[str] = PRICE_COLUMNS) -> pd.DataFrame:
+    """Apply the price schema and drop columns the analysis never reads."""
+    keep = list(columns)
+    if 'Symbol' in df.columns and 'Symbol' not in keep:
+        keep.append('Symbol')
+    return apply_schema(df, PRICE_SCHEMA, columns=keep)
+
+def read_prices_csv(path: str, columns: Iterable[str] = PRICE_COLUMNS) -> pd.DataFrame:
+    """Load a historical price CSV, reading only the needed columns."""
+    keep = set(columns)
+    data = pd.read_csv(path, index_col=0, parse_dates=True,
+                       usecols=lambda col: col == 'Date' or col in keep)
+    return optimize_prices(data, columns)
+
+def read_metrics_csv(path: str) -> pd.DataFrame:
+    """Load a value metrics CSV with the reduced-memory metrics schema."""
+    return optimize_metrics(pd.read_csv(path))
+
+def build_price_panel(data: Dict[str, pd.DataFrame],
+                      columns: Iterable[str] = PRICE_COLUMNS) -> pd.DataFrame:
+    """Stack per-ticker histories into one long panel with a categorical Symbol."""
+    frames = []
+    for symbol, history in data.items():
+        frame = history[[col for col in columns if col in history.columns]].copy()
+        frame['Symbol'] = symbol
+        frames.append(frame)
+    panel = pd.concat(frames)
+    panel['Symbol'] = pd.Categorical(panel['Symbol'], categories=list(data))
+    return optimize_prices(panel, columns)
+
+def memory_report(df: pd.DataFrame, baseline: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Report per-column memory usage, optionally against a baseline frame."""
+    usage = df.memory_usage(deep=True)
+    report = pd.DataFrame({
+        'dtype': [str(df.index.dtype)] + [str(dtype) for dtype in df.dtypes],
+        'bytes': usage.to_numpy()
+    }, index=usage.index)
+    report.loc['Total'] = ['', usage.sum()]
+
+    if baseline is not None:
+        base = baseline.memory_usage(deep=True)
+        base.loc['Total'] = base.sum()
+        report['baseline_bytes'] = base.reindex(report.index)
+        report['ratio'] = report['bytes'] / report['baseline_bytes']
+    return report
@@ -1,26 +1,107 @@
 """Stock screener based on value investing principles."""
 from typing import List, Dict, Optional
 import pandas as pd
+import numpy as np
 from .analysis import ValueAnalyzer
+from .cache import AnalysisCache
+
+# Factor name -> (metrics column, direction). 'inverse' turns a multiple into a
+# yield (P/E -> earnings yield, P/B -> book-to-market); 'lower' flips the sign.
+VALUE_FACTORS = {
+    'earnings_yield': ('P/E Ratio', 'inverse'),
+    'book_to_market': ('P/B Ratio', 'inverse'),
+    'roe': ('ROE', 'higher'),
+    'leverage': ('Debt/Equity', 'lower')
+}
+
+# Criteria keys understood by ValueScreener._meets_criteria
+SCREEN_CRITERIA = ('max_pe', 'max_pb', 'max_debt_to_equity', 'min_roe',
+                   'min_revenue_growth', 'min_earnings_growth')
+
+def rank_universe(metrics: pd.DataFrame, factors: Dict = VALUE_FACTORS,
+                  weights: Optional[Dict[str, float]] = None, group_col: Optional[str] = 'Sector',
+                  symbol_col: str = 'Symbol', top_n: Optional[int] = None) -> pd.DataFrame:
+    """Rank a universe by composite factor scores.
+
+    Each factor gets a percentile rank and a z-score within its group (e.g.
+    sector), computed with grouped vectorized operations. The composite is the
+    weighted mean of available z-scores. With `top_n`, only the best names are
+    returned, selected with argpartition.
+    """
+    weights = weights or {name: 1.0 for name in factors}
+    values = {}
+    for name, (column, direction) in factors.items():
+        # ValueMetrics reports inf for zero or negative denominators; treat as missing
+        raw = metrics[column].astype(float).replace([np.inf, -np.inf], np.nan)
+        if direction == 'inverse':
+            raw = 1.0 / raw.where(raw > 0)
+        elif direction == 'lower':
+            raw = -raw
+        values[name] = raw
+    scores = pd.DataFrame(values, index=metrics.index)
+
+    if group_col is not None and group_col in metrics.columns:
+        groups = metrics[group_col].astype(object).fillna('Unknown')
+    else:
+        groups = pd.Series('All', index=metrics.index)
+    grouped = scores.groupby(groups)
+    percentiles = grouped.rank(pct=True) * 100
+    std = grouped.transform('std')
+    zscores = ((scores - grouped.transform('mean')) / std.where(std > 0)).clip(-3, 3)
+
+    weight_vector = np.array([weights.get(name, 0.0) for name in factors])
+    z = zscores.to_numpy()
+    available = ~np.isnan(z)
+    total_weight = (available * weight_vector).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        composite = np.where(available, z, 0.0) @ weight_vector / total_weight
+
+    result = pd.DataFrame({symbol_col: metrics[symbol_col], 'Group': groups})
+    result = result.join(percentiles.add_suffix('_pct')).join(zscores.add_suffix('_z'))
+    result['Composite Score'] = composite
+    result['Composite Percentile'] = result['Composite Score'].rank(pct=True) * 100
+
+    ranked = np.nan_to_num(composite, nan=-np.inf)
+    if top_n is not None and top_n < len(result):
+        top = np.argpartition(-ranked, top_n - 1)[:top_n]
+        order = top[np.argsort(-ranked[top], kind='stable')]
+    else:
+        order = np.argsort(-ranked, kind='stable')
+    return result.iloc[order].reset_index(drop=True)
 
 class ValueScreener:
-    def __init__(self, api_key: Optional[str] = None):
-        self.analyzer = ValueAnalyzer(api_key)
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[AnalysisCache] = None):
+        self.analyzer = ValueAnalyzer(api_key, cache=cache)
     
     def screen_stocks(self, symbols: List[str], criteria: Dict) -> pd.DataFrame:
         """Screen stocks based on value investing criteria."""
-        results = []
+        analyses = {}
         
         for symbol in symbols:
             try:
-                analysis = self.analyzer.analyze_stock(symbol)
-                if self._meets_criteria(analysis, criteria):
-                    results.append(self._format_result(symbol, analysis))
+                analyses[symbol] = self.analyzer.analyze_stock(symbol)
             except Exception as e:
                 print(f"Error analyzing {symbol}: {str(e)}")
         
+        return self.screen_analyses(analyses, criteria)
+    
+    def screen_analyses(self, analyses: Dict[str, Dict], criteria: Dict) -> pd.DataFrame:
+        """Screen already computed analyses without fetching or recomputing."""
+        results = [
+            self._format_result(symbol, analysis)
+            for symbol, analysis in analyses.items()
+            if self._meets_criteria(analysis, criteria)
+        ]
         return pd.DataFrame(results)
     
+    def rank_analyses(self, analyses: Dict[str, Dict], top_n: Optional[int] = None,
+                      factors: Dict = VALUE_FACTORS) -> pd.DataFrame:
+        """Rank already computed analyses by composite value and quality factors."""
+        metrics = pd.DataFrame([self._format_result(symbol, analysis)
+                                for symbol, analysis in analyses.items()])
+        metrics = metrics.rename(columns={'ROE (%)': 'ROE'})
+        return rank_universe(metrics, factors, group_col=None, top_n=top_n)
+    
     def _meets_criteria(self, analysis: Dict, criteria: Dict) -> bool:
         """Check if stock meets screening criteria."""
         metrics = analysis['fundamental_metrics']
@@ -0,0 +1,182 @@
+"""Long-running screening service that keeps the universe's analyses in memory."""
+import argparse
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+import numpy as np
+from .cache import AnalysisCache
+from .screener import SCREEN_CRITERIA, ValueScreener
+
+logger = logging.getLogger(__name__)
+
+class ScreeningService:
+    def __init__(self, symbols: List[str], screener: Optional[ValueScreener] = None,
+                 refresh_interval: float = 3600.0):
+        """Warm in-memory state for screen and analyze queries.
+
+        Analyses for the whole universe are computed once, then refreshed in a
+        background thread every `refresh_interval` seconds. Queries read the
+        current snapshot and never wait on a refresh.
+        """
+        self.symbols = list(symbols)
+        self.screener = screener or ValueScreener()
+        self.refresh_interval = refresh_interval
+        self.last_refresh: Optional[float] = None
+        self._analyses: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> None:
+        """Recompute every symbol's analysis and swap in the new snapshot."""
+        analyses = {}
+        with self._lock:
+            symbols = list(self.symbols)
+        for symbol in symbols:
+            try:
+                # Re-fetch statements so new filings reach a cached analyzer
+                analyses[symbol] = self.screener.analyzer.analyze_stock(symbol, revalidate=True)
+            except Exception as e:
+                logger.error(f"Error analyzing {symbol}: {str(e)}")
+        with self._lock:
+            # Keep symbols added by analyze() while this refresh was running
+            refreshed = set(symbols)
+            added = {symbol: analysis for symbol, analysis in self._analyses.items()
+                     if symbol not in refreshed}
+            self._analyses = {**analyses, **added}
+            self.last_refresh = time.time()
+        logger.info(f"Refreshed {len(analyses)} of {len(symbols)} symbols")
+
+    def start(self) -> None:
+        """Load the universe and start the background refresh thread."""
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+    def screen(self, criteria: Dict) -> List[Dict]:
+        """Screen the in-memory universe; unknown criteria raise ValueError."""
+        unknown = sorted(set(criteria) - set(SCREEN_CRITERIA))
+        if unknown:
+            raise ValueError(f"Unknown criteria: {unknown}")
+        with self._lock:
+            analyses = self._analyses
+        return self.screener.screen_analyses(analyses, criteria).to_dict('records')
+
+    def analyze(self, symbol: str) -> Dict:
+        """Return a symbol's analysis, adding a new symbol to the refreshed universe."""
+        with self._lock:
+            analysis = self._analyses.get(symbol)
+        if analysis is None:
+            analysis = self.screener.analyzer.analyze_stock(symbol)
+            with self._lock:
+                self._analyses = {**self._analyses, symbol: analysis}
+                if symbol not in self.symbols:
+                    self.symbols.append(symbol)
+        return analysis
+
+    def health(self) -> Dict:
+        """Report how many symbols are loaded and when they were refreshed."""
+        with self._lock:
+            return {
+                'symbols': len(self._analyses),
+                'last_refresh': self.last_refresh
+            }
+
+def _to_json(value) -> str:
+    """Serialize results, converting numpy scalars and non-finite floats."""
+    def convert(obj):
+        if isinstance(obj, dict):
+            return {key: convert(val) for key, val in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [convert(val) for val in obj]
+        if isinstance(obj, np.generic):
+            obj = obj.item()
+        if isinstance(obj, float) and not np.isfinite(obj):
+            return None
+        return obj
+    return json.dumps(convert(value))
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    service: ScreeningService = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        try:
+            if parts == ['health']:
+                self._send(200, self.service.health())
+            elif parts == ['screen']:
+                criteria = {key: float(values[-1]) for key, values in parse_qs(url.query).items()}
+                self._send(200, self.service.screen(criteria))
+            elif len(parts) == 2 and parts[0] == 'analyze':
+                self._send(200, self.service.analyze(parts[1].upper()))
+            else:
+                self._send(404, {'error': f'Unknown endpoint: {url.path}'})
+        except ValueError as e:
+            self._send(400, {'error': str(e)})
+        except Exception as e:
+            logger.error(f"Error handling {self.path}: {str(e)}")
+            self._send(500, {'error': str(e)})
+
+    def _send(self, status: int, payload) -> None:
+        body = _to_json(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+def make_server(service: ScreeningService, host: str = '127.0.0.1',
+                port: int = 8050) -> ThreadingHTTPServer:
+    """Create an HTTP server answering /health, /screen and /analyze/<symbol>."""
+    handler = type('BoundServiceHandler', (ServiceHandler,), {'service': service})
+    return ThreadingHTTPServer((host, port), handler)
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the value screening service.')
+    parser.add_argument('symbols', nargs='+', help='Ticker symbols to keep warm')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8050)
+    parser.add_argument('--refresh-interval', type=float, default=3600.0,
+                        help='Seconds between background refreshes')
+    parser.add_argument('--cache-dir', default=None,
+                        help='Directory for analysis results shared across processes')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    screener = ValueScreener(cache=AnalysisCache(directory=args.cache_dir))
+    service = ScreeningService(args.symbols, screener, refresh_interval=args.refresh_interval)
+    service.start()
+    server = make_server(service, args.host, args.port)
+    logger.info(f"Serving on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""Out-of-core chunked computation of returns, resampling and drawdown.
+
+Histories are fed in time-ordered chunks. State is carried across chunk
+boundaries so the results match running the in-memory functions in
+`analysis.py` on the full history.
+"""
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+import pandas as pd
+import numpy as np
+from pandas.tseries.frequencies import to_offset
+
+def period_end_rule(freq: str) -> str:
+    """Map 'M'/'Q'/'Y' to the period-end alias the installed pandas accepts."""
+    if freq in ('M', 'Q', 'Y'):
+        try:
+            to_offset(freq + 'E')
+            return freq + 'E'
+        except ValueError:
+            pass
+    return freq
+
+def iter_csv_chunks(path: str, chunksize: int = 1_000_000,
+                    columns: Iterable[str] = ('Close',)) -> Iterator[pd.DataFrame]:
+    """Read a time-ordered price CSV in chunks without loading it whole."""
+    keep = set(columns)
+    reader = pd.read_csv(path, index_col=0, parse_dates=True, chunksize=chunksize,
+                         usecols=lambda col: col == 'Date' or col in keep)
+    for chunk in reader:
+        yield chunk
+
+class _ChunkedPctChange:
+    def __init__(self):
+        self._tail: Optional[pd.Series] = None
+
+    def update(self, values: pd.Series) -> pd.Series:
+        """pct_change for a chunk, using the carried tail of earlier chunks."""
+        if values.empty:
+            return values.astype(float)
+        if self._tail is None:
+            returns = values.pct_change()
+        else:
+            returns = pd.concat([self._tail, values]).pct_change().iloc[len(self._tail):]
+        self._carry(values)
+        return returns
+
+    def _carry(self, values: pd.Series) -> None:
+        # The last valid value plus a trailing NaN marker reproduces pct_change
+        # across the boundary whether or not pandas pads missing values
+        valid = np.flatnonzero(values.notna().to_numpy())
+        if valid.size == 0:
+            if self._tail is not None and self._tail.notna().iloc[-1]:
+                self._tail = pd.concat([self._tail, values.iloc[-1:]])
+            return
+        last = valid[-1]
+        self._tail = values.iloc[[last]] if last == len(values) - 1 else values.iloc[[last, -1]]
+
+class _ChunkedResampler:
+    def __init__(self, rule: str):
+        self.rule = period_end_rule(rule)
+        self._pending: Optional[pd.Series] = None
+        self._returns = _ChunkedPctChange()
+
+    def update(self, values: pd.Series) -> pd.Series:
+        """Emit returns for buckets closed by this chunk; keep the open bucket pending."""
+        buckets = values.resample(self.rule).last()
+        if buckets.empty:
+            return buckets
+        if self._pending is not None:
+            label = self._pending.index[0]
+            if buckets.index[0] == label:
+                if np.isnan(buckets.iloc[0]):
+                    buckets.iloc[0] = self._pending.iloc[0]
+            else:
+                full = pd.date_range(label, buckets.index[-1], freq=self.rule)
+                buckets = pd.concat([self._pending, buckets]).reindex(full)
+        self._pending = buckets.iloc[-1:]
+        return self._returns.update(buckets.iloc[:-1])
+
+    def finalize(self) -> pd.Series:
+        """Emit the last, still open bucket."""
+        if self._pending is None:
+            return pd.Series(dtype=float)
+        pending, self._pending = self._pending, None
+        return self._returns.update(pending)
+
+class _ChunkedReturnMetrics:
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._cumsum: Optional[float] = None
+        self._peak: Optional[float] = None
+        self.max_drawdown = np.nan
+
+    def update(self, returns: pd.Series) -> None:
+        """Merge a chunk's moments and carry the cumulative-sum drawdown state."""
+        valid = returns.dropna()
+        if not valid.empty:
+            n, mean = len(valid), valid.mean()
+            m2 = ((valid - mean) ** 2).sum()
+            total = self.count + n
+            delta = mean - self.mean
+            self.mean += delta * n / total
+            self.m2 += m2 + delta ** 2 * self.count * n / total
+            self.count = total
+
+        returns = returns.reset_index(drop=True)
+        if self._cumsum is None:
+            cumsum = returns.cumsum()
+            peak = cumsum.cummax()
+        else:
+            # Prepend the carried sum so the additions happen in the same order
+            cumsum = pd.concat([pd.Series([self._cumsum]), returns], ignore_index=True).cumsum().iloc[1:]
+            peak = pd.concat([pd.Series([self._peak]), cumsum]).cummax().iloc[1:]
+        if cumsum.last_valid_index() is not None:
+            self._cumsum = cumsum.loc[cumsum.last_valid_index()]
+            self._peak = peak.loc[peak.last_valid_index()]
+            self.max_drawdown = np.fmin(self.max_drawdown, (cumsum - peak).min())
+
+    def result(self) -> Dict[str, float]:
+        """Same keys and conventions as analysis.calculate_metrics."""
+        std = np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        mean = self.mean if self.count else np.nan
+        return {
+            'Annual Return': mean * 252,
+            'Volatility': std * np.sqrt(252),
+            'Sharpe Ratio': (mean * 252) / (std * np.sqrt(252)),
+            'Max Drawdown': self.max_drawdown
+        }
+
+class StreamingAnalysis:
+    def __init__(self, column: str = 'Close'):
+        """Chunked equivalent of calculate_returns and calculate_metrics."""
+        self.column = column
+        self._daily = _ChunkedPctChange()
+        self._monthly = _ChunkedResampler('M')
+        self._annual = _ChunkedResampler('Y')
+        self._metrics = _ChunkedReturnMetrics()
+        self._last_timestamp = None
+
+    def update(self, chunk: pd.DataFrame) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """Process the next chunk; returns the daily, monthly and annual returns it completes."""
+        values = chunk[self.column]
+        if values.empty:
+            empty = pd.Series(dtype=float)
+            return empty, empty, empty
+        if self._last_timestamp is not None and values.index[0] <= self._last_timestamp:
+            raise ValueError('Chunks must be in strictly increasing time order')
+        self._last_timestamp = values.index[-1]
+
+        daily = self._daily.update(values)
+        self._metrics.update(daily)
+        return daily, self._monthly.update(values), self._annual.update(values)
+
+    def finalize(self) -> Tuple[pd.Series, pd.Series]:
+        """Flush the open monthly and annual buckets."""
+        return self._monthly.finalize(), self._annual.finalize()
+
+    def metrics(self) -> Dict[str, float]:
+        return self._metrics.result()
+
+def run_chunked(chunks: Iterable[pd.DataFrame], column: str = 'Close',
+                sink: Optional[Callable[[pd.Series, pd.Series, pd.Series], None]] = None
+                ) -> Dict[str, float]:
+    """Stream chunks through StreamingAnalysis and return the performance metrics.
+
+    Per-chunk returns are handed to `sink` (e.g. to append to disk) instead of
+    being kept in memory.
+    """
+    analysis = StreamingAnalysis(column)
+    for chunk in chunks:
+        outputs = analysis.update(chunk)
+        if sink is not None:
+            sink(*outputs)
+    monthly, annual = analysis.finalize()
+    if sink is not None:
+        sink(pd.Series(dtype=float), monthly, annual)
+    return analysis.metrics()
+
+def calculate_returns_chunked(chunks: Iterable[pd.DataFrame],
+                              column: str = 'Close') -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """Collect the chunked daily, monthly and annual returns into full series."""
+    parts = ([], [], [])
+
+    def collect(*outputs):
+        for part, output in zip(parts, outputs):
+            if not output.empty:
+                part.append(output)
+
+    run_chunked(chunks, column, sink=collect)
+    return tuple(pd.concat(part) if part else pd.Series(dtype=float) for part in parts)
@@ -0,0 +1,112 @@
+"""Trailing-twelve-month statements maintained incrementally from quarterly filings."""
+from collections import deque
+from typing import Dict, List, Mapping, Optional
+import pandas as pd
+import numpy as np
+from .metrics import ValueMetrics
+
+# Income statement items are summed over four quarters; balance sheet items
+# are point-in-time, so the latest quarter's values are used as they are
+FLOW_ITEMS = ['Total Revenue', 'Cost of Revenue', 'Operating Income', 'Net Income',
+              'EPS', 'Dividends Paid']
+STOCK_ITEMS = ['Total Assets', 'Inventory', 'Total Debt', 'Total Stockholder Equity',
+               'Book Value per Share']
+
+class TTMTracker:
+    def __init__(self, flow_items: List[str] = FLOW_ITEMS, stock_items: List[str] = STOCK_ITEMS):
+        """Per-symbol TTM sums updated in O(1) when a new quarter is filed."""
+        self.flow_items = list(flow_items)
+        self.stock_items = list(stock_items)
+        self._quarters: Dict[str, deque] = {}
+        self._sums: Dict[str, np.ndarray] = {}
+        self._missing: Dict[str, np.ndarray] = {}
+        self._balance: Dict[str, Dict[str, float]] = {}
+        self.metrics = ValueMetrics(pd.DataFrame())
+
+    def __contains__(self, symbol: str) -> bool:
+        quarters = self._quarters.get(symbol)
+        return quarters is not None and len(quarters) == 4
+
+    def add_filing(self, symbol: str, period_end, income: Mapping,
+                   balance: Optional[Mapping] = None) -> bool:
+        """Roll a new quarter into the TTM window.
+
+        The oldest of the four quarters is subtracted and the new one added.
+        A filing for the latest stored quarter is treated as a restatement and
+        replaces it; anything older is ignored. Items the filing doesn't
+        report stay missing in the TTM total until they leave the window.
+        Returns whether state changed.
+        """
+        period_end = pd.Timestamp(period_end)
+        flows = np.array([income.get(item, np.nan) for item in self.flow_items], dtype=float)
+        quarters = self._quarters.setdefault(symbol, deque())
+        sums = self._sums.setdefault(symbol, np.zeros(len(self.flow_items)))
+        missing = self._missing.setdefault(symbol, np.zeros(len(self.flow_items), dtype=int))
+
+        if quarters and period_end < quarters[-1][0]:
+            return False
+        if quarters and period_end == quarters[-1][0]:
+            removed = quarters.pop()[1]
+        elif len(quarters) == 4:
+            removed = quarters.popleft()[1]
+        else:
+            removed = None
+        if removed is not None:
+            sums -= np.nan_to_num(removed)
+            missing -= np.isnan(removed)
+        quarters.append((period_end, flows))
+        sums += np.nan_to_num(flows)
+        missing += np.isnan(flows)
+
+        if balance is not None:
+            self._balance[symbol] = {item: float(balance.get(item, np.nan))
+                                     for item in self.stock_items}
+        return True
+
+    def load_history(self, symbol: str, quarterly: Dict[str, pd.DataFrame]) -> None:
+        """Seed a symbol from quarterly statements laid out latest period first."""
+        income = quarterly['income_statement'].iloc[:4].iloc[::-1]
+        balance = quarterly['balance_sheet']
+        for period_end, row in income.iterrows():
+            self.add_filing(symbol, period_end, row)
+        if not balance.empty:
+            self._balance[symbol] = {item: float(balance.iloc[0].get(item, np.nan))
+                                     for item in self.stock_items}
+
+    def ttm(self, symbol: str) -> Dict[str, float]:
+        """Trailing-twelve-month flow totals; requires four quarters.
+
+        Items missing from any quarter in the window are NaN.
+        """
+        if symbol not in self:
+            raise KeyError(f'Fewer than four quarters available for {symbol}')
+        totals = np.where(self._missing[symbol] > 0, np.nan, self._sums[symbol])
+        return dict(zip(self.flow_items, totals.tolist()))
+
+    def period_end(self, symbol: str) -> pd.Timestamp:
+        """End date of the most recent quarter in the window."""
+        return self._quarters[symbol][-1][0]
+
+    def statements(self, symbol: str) -> Dict[str, pd.DataFrame]:
+        """One-row TTM income statement and latest balance sheet, shaped like
+        DataSource.get_financial_statements."""
+        index = [self.period_end(symbol)]
+        return {
+            'income_statement': pd.DataFrame([self.ttm(symbol)], index=index),
+            'balance_sheet': pd.DataFrame([self._balance.get(symbol, {})], index=index,
+                                          columns=self.stock_items)
+        }
+
+    def ratios(self, symbol: str, price: float) -> Dict[str, float]:
+        """TTM valuation ratios with the same conventions as ValueMetrics."""
+        ttm = self.ttm(symbol)
+        balance = self._balance.get(symbol, {})
+        equity = balance.get('Total Stockholder Equity', np.nan)
+        return {
+            'pe_ratio': self.metrics.calculate_pe_ratio(price, ttm['EPS']),
+            'pb_ratio': self.metrics.calculate_pb_ratio(price, balance.get('Book Value per Share', np.nan)),
+            'debt_to_equity': self.metrics.calculate_debt_to_equity(balance.get('Total Debt', np.nan), equity),
+            'roe': self.metrics.calculate_roe(ttm['Net Income'], equity),
+            'operating_margin': self.metrics.calculate_operating_margin(
+                ttm['Operating Income'], ttm['Total Revenue'])
+        }
@@ -0,0 +1,106 @@
+"""Ticker universe normalization and validation."""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import pandas as pd
+
+# Base symbol of up to five characters with an optional share class, e.g. BRK-B
+TICKER_PATTERN = r'[A-Z0-9]{1,5}(?:-[A-Z]{1,2})?'
+_TICKER_RE = re.compile(TICKER_PATTERN)
+
+def normalize_symbols(symbols: pd.Series) -> pd.Series:
+    """Upper-case symbols and write share classes as BRK-B (not BRK.B, BRK/B or BRK B)."""
+    normalized = symbols.astype('string').str.strip().str.upper().str.lstrip('$')
+    return normalized.str.replace(r'^([A-Z0-9]+)[./ ]([A-Z]{1,2})$', r'\1-\2', regex=True)
+
+def validate_ticker(ticker: str) -> bool:
+    """Validate if a ticker symbol is valid."""
+    if not isinstance(ticker, str):
+        return False
+    return _TICKER_RE.fullmatch(ticker) is not None
+
+class Universe:
+    def __init__(self, symbols: Optional[Iterable[str]] = None,
+                 aliases: Optional[Dict[str, str]] = None):
+        """Known symbols plus an alias map, validated in bulk.
+
+        Without `symbols` only the ticker format is checked. Validation
+        results are cached per input list.
+        """
+        self.aliases: Dict[str, str] = {}
+        for alias, symbol in (aliases or {}).items():
+            key = normalize_symbols(pd.Series([alias])).iloc[0]
+            self.aliases[key] = normalize_symbols(pd.Series([symbol])).iloc[0]
+        self.symbols = None
+        if symbols is not None:
+            self.symbols = frozenset(normalize_symbols(pd.Series(list(symbols))).dropna())
+        self._validate_cached = lru_cache(maxsize=256)(self._validate)
+        self._resolve_cached = lru_cache(maxsize=4096)(self._resolve)
+
+    @classmethod
+    def from_csv(cls, path: str) -> 'Universe':
+        """Load a symbol master file with a `Symbol` column and optional
+        pipe-separated `Aliases` (e.g. "BRK.B|BRKB")."""
+        master = pd.read_csv(path, dtype=str)
+        aliases = {}
+        if 'Aliases' in master.columns:
+            exploded = master[['Symbol', 'Aliases']].dropna().assign(
+                Aliases=lambda df: df['Aliases'].str.split('|')).explode('Aliases')
+            aliases = dict(zip(exploded['Aliases'].str.strip(), exploded['Symbol']))
+        return cls(master['Symbol'], aliases)
+
+    def normalize(self, symbols: Iterable[str]) -> pd.Series:
+        """Normalize symbols and resolve aliases to canonical tickers."""
+        normalized = normalize_symbols(pd.Series(list(symbols), dtype=object))
+        if self.aliases:
+            normalized = normalized.replace(self.aliases)
+        return normalized
+
+    def validate(self, symbols: Iterable[str]) -> pd.DataFrame:
+        """Return input, canonical symbol and validity for every symbol at once."""
+        symbols = tuple(symbols)
+        try:
+            hash(symbols)
+        except TypeError:
+            # Unhashable inputs (e.g. lists) can't be cached and are never valid
+            return self._validate(symbols)
+        return self._validate_cached(symbols).copy()
+
+    def resolve(self, symbol: str) -> str:
+        """Canonical symbol for a single ticker; raises ValueError if invalid.
+
+        Results are cached per symbol, so repeated lookups are cheap.
+        """
+        if not isinstance(symbol, str):
+            raise ValueError(f"Invalid ticker: {symbol}")
+        return self._resolve_cached(symbol)
+
+    def _resolve(self, symbol: str) -> str:
+        result = self._validate((symbol,))
+        if not result['valid'].iloc[0]:
+            raise ValueError(f"Invalid ticker: {symbol}")
+        return result['symbol'].iloc[0]
+
+    def _validate(self, symbols: Tuple) -> pd.DataFrame:
+        raw = pd.Series(symbols, dtype=object)
+        is_text = raw.map(lambda value: isinstance(value, str)).astype(bool)
+        normalized = self.normalize(raw.where(is_text))
+        valid = is_text & normalized.str.fullmatch(TICKER_PATTERN).fillna(False).astype(bool)
+        if self.symbols is not None:
+            valid &= normalized.isin(self.symbols)
+        return pd.DataFrame({'input': raw, 'symbol': normalized, 'valid': valid})
+
+    def filter(self, symbols: Iterable[str]) -> List[str]:
+        """Canonical valid symbols, de-duplicated in input order."""
+        result = self.validate(symbols)
+        return list(dict.fromkeys(result.loc[result['valid'], 'symbol']))
+
+    def invalid(self, symbols: Iterable[str]) -> List:
+        """Inputs that failed validation."""
+        result = self.validate(symbols)
+        return result.loc[~result['valid'], 'input'].tolist()
+
+@lru_cache(maxsize=1)
+def default_universe() -> Universe:
+    """Format-only universe shared by the scripts and DataSource."""
+    return Universe()
@@ -4,6 +4,8 @@ import logging
 from typing import Dict, List, Union
 import time
 import requests
+from value_analysis.schema import read_metrics_csv
+from value_analysis.universe import default_universe
 
 # Configure logging
 logging.basicConfig(
@@ -13,16 +15,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def validate_ticker(ticker: str) -> bool:
-    """Validate if a ticker symbol is valid."""
-    if not isinstance(ticker, str):
-        return False
-    if not ticker.isalnum():
-        return False
-    if len(ticker) > 5 or len(ticker) < 1:
-        return False
-    return True
-
 def retry_api_call(func, max_retries: int = 3, delay: int = 1):
     """Decorator for retrying API calls."""
     def wrapper(*args, **kwargs):
@@ -100,52 +92,60 @@ def handle_missing_data(df: pd.DataFrame, columns: List[str],
                     df[col].fillna(0, inplace=True)
     return df
 
+def build_final_analysis(value_metrics: pd.DataFrame,
+                         performance_metrics: pd.DataFrame) -> pd.DataFrame:
+    """Score value metrics with the Buffett criteria and merge in performance metrics."""
+    # Validate and handle missing data
+    value_metrics = handle_missing_data(
+        value_metrics, 
+        ['P/E Ratio', 'P/B Ratio', 'Debt/Equity', 'ROE', 'Profit Margin', 'Dividend Yield']
+    )
+    
+    # Ensure consistent column naming
+    value_metrics = value_metrics.rename(columns={'Symbol': 'Ticker'})
+    
+    # Validate tickers
+    invalid_tickers = default_universe().invalid(value_metrics['Ticker'])
+    if invalid_tickers:
+        logger.warning(f"Found invalid tickers: {invalid_tickers}")
+    
+    # Apply Buffett criteria
+    try:
+        scores = buffett_criteria(value_metrics)
+    except ValueError as e:
+        logger.error(f"Error in Buffett criteria calculation: {str(e)}")
+        raise
+    
+    # Combine metrics with proper error handling
+    try:
+        # Attach scores before merging so they stay with their tickers when
+        # either side is missing some
+        final_analysis = pd.merge(
+            value_metrics.assign(**{'Buffett Score': scores['Total Score']}),
+            performance_metrics,
+            on='Ticker',
+            how='inner'
+        )
+        final_analysis['Buffett Score'] = final_analysis.pop('Buffett Score')
+    except Exception as e:
+        logger.error(f"Error merging datasets: {str(e)}")
+        raise
+    
+    return final_analysis
+
 def main():
     try:
         logger.info("Starting value screening process")
         
         # Load metrics with validation
         try:
-            value_metrics = pd.read_csv('value_metrics.csv')
+            value_metrics = read_metrics_csv('value_metrics.csv')
             performance_metrics = pd.read_csv('performance_metrics.csv')
         except FileNotFoundError as e:
             logger.error(f"Required CSV file not found: {str(e)}")
             raise
         
-        # Validate and handle missing data
-        value_metrics = handle_missing_data(
-            value_metrics, 
-            ['P/E Ratio', 'P/B Ratio', 'Debt/Equity', 'ROE', 'Profit Margin', 'Dividend Yield']
-        )
-        
-        # Ensure consistent column naming
-        value_metrics = value_metrics.rename(columns={'Symbol': 'Ticker'})
-        
-        # Validate tickers
-        invalid_tickers = [ticker for ticker in value_metrics['Ticker'] 
-                          if not validate_ticker(ticker)]
-        if invalid_tickers:
-            logger.warning(f"Found invalid tickers: {invalid_tickers}")
-        
-        # Apply Buffett criteria
-        try:
-            scores = buffett_criteria(value_metrics)
-        except ValueError as e:
-            logger.error(f"Error in Buffett criteria calculation: {str(e)}")
-            raise
-        
-        # Combine metrics with proper error handling
-        try:
-            final_analysis = pd.merge(
-                value_metrics,
-                performance_metrics,
-                on='Ticker',
-                how='inner'
-            )
-            final_analysis['Buffett Score'] = scores['Total Score']
-        except Exception as e:
-            logger.error(f"Error merging datasets: {str(e)}")
-            raise
+        final_analysis = build_final_analysis(value_metrics, performance_metrics)
         
         # Save results
         try: